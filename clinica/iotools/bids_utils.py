@@ -1,5 +1,7 @@
 """Methods used by BIDS converters."""
 
+import csv
+import datetime
 import json
 import os
 from enum import Enum
@@ -9,6 +11,7 @@ from typing import BinaryIO, List, Optional, Union
 import pandas as pd
 
 from clinica.utils.pet import Tracer
+from clinica.utils.stream import cprint
 
 
 class StudyName(str, Enum):
@@ -351,7 +354,7 @@ def create_scans_dict(
     name_column_ses: str,
     ses_dict: dict,
 ) -> pd.DataFrame:
-    """[summary].
+    """Extract the scans information of all sessions of all participants.
 
     Parameters
     ----------
@@ -380,121 +383,97 @@ def create_scans_dict(
     -------
     pd.DataFrame :
         A pandas DataFrame that contains the scans information for all sessions of all participants.
+        It has one row per value, with columns "bids_id", "session_id", "modality", "field" and "value".
+        When a field is provided several times for the same modality, the last value prevails.
     """
-    import datetime
-
-    from clinica.utils.pet import Tracer
-    from clinica.utils.stream import cprint
-
-    scans_dict = {}
-    prev_file = ""
-    prev_sheet = ""
-
-    # Init the dictionary with the subject ids
-    for bids_id in bids_ids:
-        scans_dict[bids_id] = dict()
-        for session_id in {"ses-" + key for key in ses_dict[bids_id].keys()}:
-            scans_dict[bids_id][session_id] = {
-                "T1/DWI/fMRI/FMAP": {},
-                Tracer.PIB: {},
-                Tracer.AV45: {},
-                Tracer.FMM: {},
-                Tracer.FDG: {},
-            }
-
+    scans = []
     scans_specs = pd.read_csv(clinical_specifications_folder / "scans.tsv", sep="\t")
-    fields_dataset = []
-    fields_location = []
-    fields_bids = []
-    fields_mod = []
-
-    # Extract the fields available and the corresponding bids name, location and type
-    for i in range(0, len(scans_specs[study_name.value])):
-        field = scans_specs[study_name.value][i]
-        if not pd.isnull(field):
-            fields_dataset.append(field)
-            fields_bids.append(scans_specs["BIDS CLINICA"][i])
-            fields_location.append(scans_specs[f"{study_name.value} location"][i])
-            fields_mod.append(scans_specs["Modalities related"][i])
+    scans_specs = scans_specs[scans_specs[study_name.value].notna()]
+    location_name = f"{study_name.value} location"
+    # Several fields can be located in the same file, read each file only once
+    files_to_read = {
+        location: _load_scans_metadata(
+            clinical_data_dir, location, study_name, name_column_ids, name_column_ses
+        )
+        for location in scans_specs[location_name].unique()
+    }
+    original_ids = {
+        bids_id: int(bids_id.replace(f"sub-{study_name.value}", ""))
+        for bids_id in bids_ids
+    }
 
     # For each field available extract the original name, extract from the file all the values and fill a data structure
-    for i in range(0, len(fields_dataset)):
-        # Location is composed by file/sheet
-        location = fields_location[i].split("/")
-        file_name = location[0]
-        sheet = location[1] if len(location) > 1 else ""
-        # Check if the file to read is already opened
-        if file_name == prev_file and sheet == prev_sheet:
-            pass
-        else:
-            file_ext = os.path.splitext(file_name)[1]
-            files_to_read = [f for f in clinical_data_dir.glob(file_name)]
-            if file_ext == ".xlsx":
-                file_to_read = pd.read_excel(files_to_read[0], sheet_name=sheet)
-            elif file_ext == ".csv":
-                file_path = files_to_read[0]
-
-                # Fix for malformed flutemeta file in AIBL (see #796).
-                # Some flutemeta lines contain a non-coded string value at the second-to-last position. This value
-                # contains a comma which adds an extra column and shifts the remaining values to the right. In this
-                # case, we just remove the erroneous content and replace it with -4 which AIBL uses as n/a value.
-                on_bad_lines = (  # noqa: E731
-                    lambda bad_line: bad_line[:-3] + [-4, bad_line[-1]]
-                    if "flutemeta" in file_path and study_name == StudyName.AIBL
-                    else "error"
-                )
-
-                file_to_read = pd.read_csv(
-                    file_path,
-                    sep=",",
-                    engine="python",
-                    on_bad_lines=on_bad_lines,
-                )
-            prev_file = file_name
-            prev_sheet = sheet
-
-        for bids_id in bids_ids:
-            original_id = bids_id.replace(f"sub-{study_name.value}", "")
+    for field_dataset, field_bids, field_mod, location in zip(
+        scans_specs[study_name.value],
+        scans_specs["BIDS CLINICA"],
+        scans_specs["Modalities related"],
+        scans_specs[location_name],
+    ):
+        file_to_read = files_to_read[location]
+        for bids_id, original_id in original_ids.items():
             for session_name in {"ses-" + key for key in ses_dict[bids_id].keys()}:
-                # When comparing sessions, remove the "-ses" prefix IF it exists
-                row_to_extract = file_to_read[
-                    (file_to_read[name_column_ids] == int(original_id))
-                    & (
-                        list(
-                            filter(
-                                None, file_to_read[name_column_ses].str.split("ses-")
-                            )
-                        )[0][0]
-                        == ses_dict[bids_id][
-                            list(filter(None, session_name.split("ses-")))[0]
-                        ]
-                    )
-                ].index.tolist()
-                if len(row_to_extract) > 0:
-                    row_to_extract = row_to_extract[0]
-                    # Fill the dictionary with all the information
-                    value = file_to_read.iloc[row_to_extract][fields_dataset[i]]
+                viscode = ses_dict[bids_id][session_name.removeprefix("ses-")]
+                if (original_id, viscode) in file_to_read.index:
+                    value = file_to_read.loc[(original_id, viscode), field_dataset]
 
                     if study_name == StudyName.AIBL:  # Deal with special format in AIBL
                         if value == "-4":
                             value = "n/a"
-                        elif fields_bids[i] == "acq_time":
+                        elif field_bids == "acq_time":
                             date_obj = datetime.datetime.strptime(value, "%m/%d/%Y")
                             value = date_obj.strftime("%Y-%m-%dT%H:%M:%S")
-
-                    scans_dict[bids_id][session_name][fields_mod[i]][
-                        fields_bids[i]
-                    ] = value
                 else:
                     cprint(
                         f"Scans information for {bids_id} {session_name} not found.",
                         lvl="info",
                     )
-                    scans_dict[bids_id][session_name][fields_mod[i]][
-                        fields_bids[i]
-                    ] = "n/a"
+                    value = "n/a"
+                scans.append((bids_id, session_name, field_mod, field_bids, value))
 
-    return scans_dict
+    return pd.DataFrame(
+        scans, columns=["bids_id", "session_id", "modality", "field", "value"]
+    )
+
+
+def _load_scans_metadata(
+    clinical_data_dir: Path,
+    location: str,
+    study_name: StudyName,
+    name_column_ids: str,
+    name_column_ses: str,
+) -> pd.DataFrame:
+    """Load the clinical file at the given location, indexed by subject id and viscode.
+
+    The location is composed by file/sheet. The rows are indexed by subject id and
+    viscode (without the "ses-" prefix IF it exists) so that the row of a given session
+    can be retrieved without scanning the whole file. Only the first row of each
+    (subject id, viscode) pair is kept.
+    """
+    file_name, _, sheet = location.partition("/")
+    file_path = next(clinical_data_dir.glob(file_name))
+    if file_path.suffix == ".xlsx":
+        file_to_read = pd.read_excel(file_path, sheet_name=sheet)
+    # Fix for malformed flutemeta file in AIBL (see #796).
+    # Some flutemeta lines contain a non-coded string value at the second-to-last position. This value
+    # contains a comma which adds an extra column and shifts the remaining values to the right. In this
+    # case, we just remove the erroneous content and replace it with -4 which AIBL uses as n/a value.
+    # A callable on_bad_lines requires the Python engine, so the faster C engine is used otherwise.
+    elif "flutemeta" in file_path.name and study_name == StudyName.AIBL:
+        file_to_read = pd.read_csv(
+            file_path,
+            sep=",",
+            engine="python",
+            on_bad_lines=lambda bad_line: bad_line[:-3] + [-4, bad_line[-1]],
+        )
+    else:
+        file_to_read = pd.read_csv(file_path, sep=",", low_memory=False)
+    file_to_read.index = pd.MultiIndex.from_arrays(
+        [
+            file_to_read[name_column_ids],
+            file_to_read[name_column_ses].astype(str).str.removeprefix("ses-"),
+        ]
+    )
+    return file_to_read[~file_to_read.index.duplicated()]
 
 
 def _write_bids_dataset_description(
@@ -652,9 +631,9 @@ def _get_pet_tracer_from_filename(filename: str) -> Tracer:
 
 
 def write_scans_tsv(
-    bids_dir: Path, participant_ids: List[str], scans_dict: dict
+    bids_dir: Path, participant_ids: List[str], scans: pd.DataFrame
 ) -> None:
-    """Write the scans dict into TSV files.
+    """Write the scans information into TSV files.
 
     Parameters
     ----------
@@ -664,8 +643,8 @@ def write_scans_tsv(
     participant_ids : List[str]
         List of participant ids for which to write the scans TSV files.
 
-    scans_dict : dict
-        Dictionary containing scans metadata.
+    scans : pd.DataFrame
+        DataFrame containing scans metadata.
 
         .. note::
             This is the output of the function
@@ -677,9 +656,20 @@ def write_scans_tsv(
     """
     supported_modalities = ("anat", "dwi", "func", "pet")
 
+    # Pivot the scans information to get the fields of each (subject, session, modality)
+    scans_fields = {
+        key: dict(zip(group.field, group.value))
+        for key, group in scans.drop_duplicates(
+            ["bids_id", "session_id", "modality", "field"], keep="last"
+        ).groupby(["bids_id", "session_id", "modality"])
+    }
+
     for sub in participant_ids:
-        for session_path in (bids_dir / sub).glob("ses-*"):
-            scans_df = pd.DataFrame()
+        for session_path in (bids_dir / sub).iterdir():
+            if not (session_path.name.startswith("ses-") and session_path.is_dir()):
+                continue
+            rows = []
+            fields = {}
             tsv_file = (
                 bids_dir
                 / sub
@@ -698,15 +688,23 @@ def write_scans_tsv(
                             if mod.name in ("anat", "dwi", "func")
                             else _get_pet_tracer_from_filename(file.name).value
                         )
-                        row_to_append = pd.DataFrame(
-                            scans_dict[sub][session_path.name][f_type], index=[0]
-                        )
-                        row_to_append.insert(
-                            0, "filename", str(Path(mod.name) / Path(file.name))
+                        row_fields = scans_fields.get(
+                            (sub, session_path.name, f_type), {}
                         )
-                        scans_df = pd.concat([scans_df, row_to_append])
-            scans_df = scans_df.set_index("filename").fillna("n/a")
-            scans_df.to_csv(tsv_file, sep="\t", encoding="utf8")
+                        fields.update(dict.fromkeys(row_fields))
+                        rows.append((str(Path(mod.name) / Path(file.name)), row_fields))
+            # The files are small, write them directly rather than through a DataFrame
+            with open(tsv_file, "w", newline="", encoding="utf8") as fp:
+                writer = csv.writer(fp, delimiter="\t", lineterminator="\n")
+                writer.writerow(["filename", *fields])
+                writer.writerows(
+                    [filename, *(_format_scans_value(row.get(f)) for f in fields)]
+                    for filename, row in rows
+                )
+
+
+def _format_scans_value(value) -> str:
+    return "n/a" if value is None or pd.isna(value) else value
 
 
 def get_bids_subjs_list(bids_path: Path) -> List[str]:
@@ -153,22 +153,22 @@ def correct_diagnosis_sc_adni3(
         dxsum_df = load_clinical_csv(clinical_data_dir, "DXSUM_PDXCONV").set_index(
             ["PTID", "VISCODE2"]
         )
-    missing_sc = participants_df[
-        participants_df.original_study == ADNIStudy.ADNI3.value
-    ]
+    missing_sc = participants_df.loc[
+        participants_df.original_study == ADNIStudy.ADNI3.value, "alternative_id_1"
+    ].values
     participants_df.set_index("alternative_id_1", drop=True, inplace=True)
-    for alternative_id in missing_sc.alternative_id_1.values:
-        try:
-            diagnosis_sc = diagnosis_dict[
-                dxsum_df.loc[(alternative_id, "sc"), "DIAGNOSIS"].values[0]
-            ]
-            participants_df.loc[alternative_id, "diagnosis_sc"] = diagnosis_sc
-        except KeyError:
-            cprint(
-                msg=f"Unknown screening diagnosis for subject {alternative_id}.",
-                lvl="warning",
-            )
-            participants_df.loc[alternative_id, "diagnosis_sc"] = "n/a"
+    # Keep the first screening diagnosis of each subject
+    screening_diagnoses = dxsum_df.loc[
+        dxsum_df.index.get_level_values("VISCODE2") == "sc", "DIAGNOSIS"
+    ].droplevel("VISCODE2")
+    screening_diagnoses = screening_diagnoses[~screening_diagnoses.index.duplicated()]
+    diagnosis_sc = screening_diagnoses.reindex(missing_sc).map(diagnosis_dict)
+    for alternative_id in diagnosis_sc.index[diagnosis_sc.isna()]:
+        cprint(
+            msg=f"Unknown screening diagnosis for subject {alternative_id}.",
+            lvl="warning",
+        )
+    participants_df.loc[missing_sc, "diagnosis_sc"] = diagnosis_sc.fillna("n/a").values
 
     participants_df.reset_index(inplace=True, drop=False)
     return participants_df
@@ -316,11 +316,12 @@ def _compute_session_id(df: pd.DataFrame, csv_filename: str) -> pd.DataFrame:
             "which is supposed to encode the visit code. The columns present in "
             f"the DataFrame are: {df.columns}."
         )
-    return df.assign(
-        session_id=lambda _df: _df[visit_code_column].apply(
-            lambda x: _get_session_id_from_visit_code(x)
-        )
-    )
+    # Only a few distinct visit codes are found in a file, convert each of them once
+    session_ids = {
+        visit_code: _get_session_id_from_visit_code(visit_code)
+        for visit_code in df[visit_code_column].unique()
+    }
+    return df.assign(session_id=lambda _df: _df[visit_code_column].map(session_ids))
 
 
 def _get_visit_code_column_name(csv_filename: str) -> str:
@@ -1,3 +1,5 @@
+from functools import lru_cache
+from importlib import import_module
 from pathlib import Path
 from typing import Callable, Iterable, Optional, Union
 
@@ -14,70 +16,53 @@ ConverterInterface = Callable[
 ]
 
 
+_CONVERTERS_FOR_MODALITY = {
+    ADNIModality.T1: (ADNIModalityConverter.T1,),
+    ADNIModality.PET_FDG: (
+        ADNIModalityConverter.PET_FDG,
+        ADNIModalityConverter.PET_FDG_UNIFORM,
+    ),
+    ADNIModality.PET_AMYLOID: (
+        ADNIModalityConverter.PET_PIB,
+        ADNIModalityConverter.PET_AV45,
+    ),
+    ADNIModality.PET_TAU: (ADNIModalityConverter.PET_TAU,),
+    ADNIModality.DWI: (ADNIModalityConverter.DWI,),
+    ADNIModality.FLAIR: (ADNIModalityConverter.FLAIR,),
+    ADNIModality.FMRI: (ADNIModalityConverter.FMRI,),
+    ADNIModality.FMAP: (ADNIModalityConverter.FMAP,),
+}
+
+# Converters are referenced by (module, function name) so that their modules
+# are only imported when the converter is first requested.
+_CONVERTER_LOCATIONS = {
+    ADNIModalityConverter.T1: ("._t1", "convert_t1"),
+    ADNIModalityConverter.PET_FDG: ("._fdg_pet", "convert_fdg_pet"),
+    ADNIModalityConverter.PET_FDG_UNIFORM: ("._fdg_pet", "convert_fdg_pet_uniform"),
+    ADNIModalityConverter.PET_PIB: ("._pib_pet", "convert_pib_pet"),
+    ADNIModalityConverter.PET_AV45: ("._av45_fbb_pet", "convert_av45_fbb_pet"),
+    ADNIModalityConverter.PET_TAU: ("._tau_pet", "convert_tau_pet"),
+    ADNIModalityConverter.DWI: ("._dwi", "convert_dwi"),
+    ADNIModalityConverter.FLAIR: ("._flair", "convert_flair"),
+    ADNIModalityConverter.FMRI: ("._fmri", "convert_fmri"),
+    ADNIModalityConverter.FMAP: ("._fmap", "convert_fmap"),
+}
+
+
 def _get_converters_for_modality(
     modality: ADNIModality,
 ) -> Iterable[ADNIModalityConverter]:
     """Map a user-facing modality from ADNI to an iterable of adni modality converters."""
-    if modality == ADNIModality.T1:
-        return [ADNIModalityConverter.T1]
-    if modality == ADNIModality.PET_FDG:
-        return [ADNIModalityConverter.PET_FDG, ADNIModalityConverter.PET_FDG_UNIFORM]
-    if modality == ADNIModality.PET_AMYLOID:
-        return [ADNIModalityConverter.PET_PIB, ADNIModalityConverter.PET_AV45]
-    if modality == ADNIModality.PET_TAU:
-        return [ADNIModalityConverter.PET_TAU]
-    if modality == ADNIModality.DWI:
-        return [ADNIModalityConverter.DWI]
-    if modality == ADNIModality.FLAIR:
-        return [ADNIModalityConverter.FLAIR]
-    if modality == ADNIModality.FMRI:
-        return [ADNIModalityConverter.FMRI]
-    if modality == ADNIModality.FMAP:
-        return [ADNIModalityConverter.FMAP]
+    return _CONVERTERS_FOR_MODALITY.get(modality)
 
 
+@lru_cache
 def converter_factory(converter: ADNIModalityConverter) -> ConverterInterface:
     """Returns the converter associated with the provided ADNIModalityConverter variant."""
-    if converter == ADNIModalityConverter.T1:
-        from ._t1 import convert_t1
-
-        return convert_t1
-    if converter == ADNIModalityConverter.PET_FDG:
-        from ._fdg_pet import convert_fdg_pet
-
-        return convert_fdg_pet
-    if converter == ADNIModalityConverter.PET_FDG_UNIFORM:
-        from ._fdg_pet import convert_fdg_pet_uniform
-
-        return convert_fdg_pet_uniform
-    if converter == ADNIModalityConverter.PET_PIB:
-        from ._pib_pet import convert_pib_pet
-
-        return convert_pib_pet
-    if converter == ADNIModalityConverter.PET_AV45:
-        from ._av45_fbb_pet import convert_av45_fbb_pet
-
-        return convert_av45_fbb_pet
-    if converter == ADNIModalityConverter.PET_TAU:
-        from ._tau_pet import convert_tau_pet
-
-        return convert_tau_pet
-    if converter == ADNIModalityConverter.DWI:
-        from ._dwi import convert_dwi
-
-        return convert_dwi
-    if converter == ADNIModalityConverter.FLAIR:
-        from ._flair import convert_flair
-
-        return convert_flair
-    if converter == ADNIModalityConverter.FMRI:
-        from ._fmri import convert_fmri
-
-        return convert_fmri
-    if converter == ADNIModalityConverter.FMAP:
-        from ._fmap import convert_fmap
-
-        return convert_fmap
+    if (location := _CONVERTER_LOCATIONS.get(converter)) is None:
+        return None
+    module_name, converter_name = location
+    return getattr(import_module(module_name, package=__package__), converter_name)
 
 
 def modality_converter_factory(
@@ -78,7 +78,7 @@ def convert(
             overwrite,
             n_procs=n_procs,
         )
-    _convert_clinical_data(input_clinical_data, output_dataset)
+    _convert_clinical_data(input_clinical_data, output_dataset, n_procs=n_procs)
 
 
 def _convert_images(
@@ -141,7 +141,11 @@ def _warn_about_missing_files(files: list[list[Optional[Path]]]):
         cprint(msg=msg, lvl="warning")
 
 
-def _convert_clinical_data(input_clinical_data: Path, output_dataset: Path) -> None:
+def _convert_clinical_data(
+    input_clinical_data: Path,
+    output_dataset: Path,
+    n_procs: Optional[int] = 1,
+) -> None:
     """Conversion of the AIBL clinical data in BIDS.
 
     Parameters
@@ -151,6 +155,11 @@ def _convert_clinical_data(input_clinical_data: Path, output_dataset: Path) -> N
 
     output_dataset : Path
         The path to the BIDS directory in which to write the output.
+
+    n_procs : int, optional
+        The requested number of processes.
+        If specified, it should be between 1 and the number of available CPUs.
+        Default=1.
     """
     from clinica.iotools.bids_utils import StudyName, write_modality_agnostic_files
     from clinica.iotools.converters.aibl_to_bids.utils import (
@@ -192,7 +201,10 @@ def _convert_clinical_data(input_clinical_data: Path, output_dataset: Path) -> N
     )
     cprint("Creating sessions files...", lvl="info")
     create_sessions_tsv_file(
-        output_dataset, input_clinical_data, clinical_specifications_folder
+        output_dataset,
+        input_clinical_data,
+        clinical_specifications_folder,
+        n_procs=n_procs,
     )
     cprint("Creating scans files...", lvl="info")
     create_scans_tsv_file(
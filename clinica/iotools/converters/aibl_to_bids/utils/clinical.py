@@ -1,7 +1,20 @@
+import glob
+from datetime import datetime
+from functools import lru_cache, partial
+from multiprocessing import Pool
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
+from dateutil.relativedelta import relativedelta
+
+from clinica.iotools.bids_utils import (
+    StudyName,
+    create_scans_dict,
+    write_scans_tsv,
+)
+from clinica.utils.stream import cprint
 
 __all__ = [
     "create_participants_tsv_file",
@@ -9,6 +22,8 @@ __all__ = [
     "create_sessions_tsv_file",
 ]
 
+_DIAGNOSIS_MAPPING = {1: "CN", 2: "MCI", 3: "AD"}
+
 
 def create_participants_tsv_file(
     input_path: Path,
@@ -35,95 +50,58 @@ def create_participants_tsv_file(
         available in the BIDS dataset.
         Default=True.
     """
-    import glob
-    import os
-    from os import path
-
-    import numpy as np
-
-    from clinica.iotools.bids_utils import StudyName
-
-    fields_bids = ["participant_id"]
-    fields_dataset = []
-    prev_location = ""
-    prev_sheet = ""
     index_to_drop = []
 
     specifications = _load_specifications(
         clinical_specifications_folder, "participant.tsv"
     )
-    participant_fields_db = specifications[StudyName.AIBL.value]
-    field_location = specifications[f"{StudyName.AIBL.value} location"]
-    participant_fields_bids = specifications["BIDS CLINICA"]
-
-    # Extract the list of the available fields for the dataset (and the corresponding BIDS version)
-    for i in range(0, len(participant_fields_db)):
-        if not pd.isnull(participant_fields_db[i]):
-            fields_bids.append(participant_fields_bids[i])
-            fields_dataset.append(participant_fields_db[i])
-
-    # Init the dataframe that will be saved in the file participant.tsv
-    participant_df = pd.DataFrame(columns=fields_bids)
-
-    for i in range(0, len(participant_fields_db)):
-        # If a field not empty is found
-        if not pd.isnull(participant_fields_db[i]):
-            # Extract the file location of the field and read the value from the file
-            tmp = field_location[i].split("/")
-            location = tmp[0]
-            # If a sheet is available
-            sheet = tmp[1] if len(tmp) > 1 else ""
-            # Check if the file to open for a certain field it's the same of the previous field
-            if location == prev_location and sheet == prev_sheet:
-                pass
-            else:
-                file_ext = os.path.splitext(location)[1]
-                file_to_read_path = path.join(clinical_data_dir, location)
-
-                if file_ext == ".xlsx":
-                    file_to_read = pd.read_excel(
-                        glob.glob(file_to_read_path)[0], sheet_name=sheet
-                    )
-                elif file_ext == ".csv":
-                    file_to_read = pd.read_csv(glob.glob(file_to_read_path)[0])
-                prev_location = location
-                prev_sheet = sheet
-
-            field_col_values = []
-            # For each field in fields_dataset extract all the column values
-            for j in range(0, len(file_to_read)):
-                # Convert the alternative_id_1 to string if is an integer/float
-                if participant_fields_bids[i] == "alternative_id_1" and (
-                    file_to_read[participant_fields_db[i]].dtype == np.float64
-                    or file_to_read[participant_fields_db[i]].dtype == np.int64
-                ):
-                    if not pd.isnull(file_to_read.at[j, participant_fields_db[i]]):
-                        # value_to_append = str(file_to_read.get_value(j, participant_fields_db[i])).rstrip('.0')
-                        value_to_append = str(
-                            file_to_read.at[j, participant_fields_db[i]]
-                        )
-                    else:
-                        value_to_append = "n/a"
-                else:
-                    value_to_append = file_to_read.at[j, participant_fields_db[i]]
-                field_col_values.append(value_to_append)
-            # Add the extracted column to the participant_df
-            participant_df[participant_fields_bids[i]] = pd.Series(field_col_values)
+    specifications = specifications[specifications[StudyName.AIBL.value].notna()]
+    fields_bids = ["participant_id"] + specifications["BIDS CLINICA"].tolist()
+
+    # Read each clinical file once and extract all the fields it provides
+    columns = {}
+    for location, fields in specifications.groupby(
+        f"{StudyName.AIBL.value} location", sort=False
+    ):
+        file_to_read = _load_metadata_from_pattern(
+            clinical_data_dir,
+            location,
+            usecols=fields[StudyName.AIBL.value].unique().tolist(),
+        )
+        for field_bids, field_dataset in zip(
+            fields["BIDS CLINICA"], fields[StudyName.AIBL.value]
+        ):
+            values = file_to_read[field_dataset]
+            # Convert the alternative_id_1 to string if is an integer/float
+            if field_bids == "alternative_id_1" and values.dtype in (
+                np.float64,
+                np.int64,
+            ):
+                values = values.astype(str).where(values.notna(), "n/a")
+            columns[field_bids] = values
+
+    # Rows are aligned on the index of the first file read, as the columns
+    # used to be added one by one to the participant dataframe.
+    participant_df = pd.DataFrame(
+        columns, index=next(iter(columns.values())).index, columns=fields_bids
+    )
 
     # Compute BIDS-compatible participant ID.
     participant_df["participant_id"] = (
         f"sub-{StudyName.AIBL.value}" + participant_df["alternative_id_1"]
     )
 
-    # Keep year-of-birth only.
-    participant_df["date_of_birth"] = participant_df["date_of_birth"].str.extract(
-        r"/(\d{4}).*"
+    # Keep year-of-birth only, dates of birth are formatted as "/YYYY".
+    date_of_birth = participant_df["date_of_birth"].str
+    participant_df["date_of_birth"] = date_of_birth.slice(1, 5).where(
+        date_of_birth.startswith("/", na=False)
     )
     # Normalize sex value.
     participant_df["sex"] = participant_df["sex"].map({1: "M", 2: "F"}).fillna("n/a")
 
     # Normalize known NA values.
     participant_df.replace(-4, "n/a", inplace=True)
+    participant_df["sex"] = participant_df["sex"].astype("category")
 
     # Delete all the rows of the subjects that are not available in the BIDS dataset
     if delete_non_bids_info:
@@ -149,10 +127,28 @@ def _load_specifications(
     return pd.read_csv(specifications, sep="\t")
 
 
+def _load_metadata_from_pattern(
+    clinical_data_dir: Path,
+    location: str,
+    usecols: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """Load the clinical file described by a specification location.
+
+    The location has the form `file_pattern` or `file_pattern/sheet` for Excel files.
+    If provided, only the columns listed in `usecols` are read.
+    """
+    pattern, _, sheet = location.partition("/")
+    file_to_read = sorted(clinical_data_dir.glob(pattern))[0]
+    if file_to_read.suffix == ".xlsx":
+        return pd.read_excel(file_to_read, sheet_name=sheet, usecols=usecols)
+    return pd.read_csv(file_to_read, usecols=usecols)
+
+
 def create_sessions_tsv_file(
     input_path: Path,
     clinical_data_dir: Path,
     clinical_specifications_folder: Path,
+    n_procs: Optional[int] = 1,
 ) -> None:
     """Extract the information regarding the sessions and save them in a tsv file.
 
@@ -166,127 +162,203 @@ def create_sessions_tsv_file(
 
     clinical_specifications_folder : Path
         The path to the folder containing the clinical specification files.
-    """
-    import glob
 
-    from clinica.iotools.bids_utils import StudyName
-
-    specifications = _load_specifications(
-        clinical_specifications_folder, "sessions.tsv"
-    )
-    sessions_fields = specifications[StudyName.AIBL.value]
-    field_location = specifications[f"{StudyName.AIBL.value} location"]
-    sessions_fields_bids = specifications["BIDS CLINICA"]
-    fields_dataset = []
-    fields_bids = []
-
-    for i in range(0, len(sessions_fields)):
-        if not pd.isnull(sessions_fields[i]):
-            fields_bids.append(sessions_fields_bids[i])
-            fields_dataset.append(sessions_fields[i])
-
-    files_to_read: List[str] = []
-    sessions_fields_to_read: List[str] = []
-    for i in range(0, len(sessions_fields)):
-        # If the i-th field is available
-        if not pd.isnull(sessions_fields[i]):
-            # Load the file
-            file_to_read_path = clinical_data_dir / field_location[i]
-            files_to_read.append(glob.glob(str(file_to_read_path))[0])
-            sessions_fields_to_read.append(sessions_fields[i])
-
-    rids = pd.read_csv(files_to_read[0], dtype={"text": str}, low_memory=False).RID
-    unique_rids = list(set(rids))
-    for rid in unique_rids:
+    n_procs : int, optional
+        The requested number of processes.
+        If specified, it should be between 1 and the number of available CPUs.
+        Default=1.
+    """
+    try:
+        specifications = _load_specifications(
+            clinical_specifications_folder, "sessions.tsv"
+        )
+        sessions_fields = specifications[StudyName.AIBL.value]
+        field_location = specifications[f"{StudyName.AIBL.value} location"]
+        sessions_fields_bids = specifications["BIDS CLINICA"]
+        fields_dataset = []
+        fields_bids = []
+
+        for i in range(0, len(sessions_fields)):
+            if not pd.isnull(sessions_fields[i]):
+                fields_bids.append(sessions_fields_bids[i])
+                fields_dataset.append(sessions_fields[i])
+
+        files_to_read: List[str] = []
+        sessions_fields_to_read: List[str] = []
+        for i in range(0, len(sessions_fields)):
+            # If the i-th field is available
+            if not pd.isnull(sessions_fields[i]):
+                # Load the file
+                file_to_read_path = clinical_data_dir / field_location[i]
+                files_to_read.append(glob.glob(str(file_to_read_path))[0])
+                sessions_fields_to_read.append(sessions_fields[i])
+
+        dataframes = []
         for file in files_to_read:
             df = pd.read_csv(file, dtype={"text": str})
             if len(df.columns) == 1:
                 df = pd.read_csv(file, sep=";", low_memory=False)
+            dataframes.append(df)
+
+        # Split the clinical data per subject once, so that each subject can be processed independently
+        dataframes_per_subject = [dict(tuple(df.groupby("RID"))) for df in dataframes]
+        subjects_data = [
+            (
+                rid,
+                [
+                    subject_dfs.get(rid, df.iloc[0:0])
+                    for subject_dfs, df in zip(dataframes_per_subject, dataframes)
+                ],
+            )
+            for rid in set(dataframes[0].RID)
+        ]
+        create_sessions_tsv_file_ = partial(
+            _create_sessions_tsv_file_for_subject,
+            sessions_fields_to_read=sessions_fields_to_read,
+            input_path=input_path,
+            clinical_data_dir=clinical_data_dir,
+        )
+        # If n_procs==1 do not rely on a Process Pool to enable classical debugging
+        if n_procs == 1:
+            for subject_data in subjects_data:
+                create_sessions_tsv_file_(subject_data)
+            return
+        with Pool(processes=n_procs) as pool:
+            pool.map(create_sessions_tsv_file_, subjects_data)
+    finally:
+        # The alternative exam dates are cached for the duration of one conversion only
+        _load_alternative_exam_dates.cache_clear()
+
+
+def _create_sessions_tsv_file_for_subject(
+    subject_data: Tuple[int, List[pd.DataFrame]],
+    sessions_fields_to_read: List[str],
+    input_path: Path,
+    clinical_data_dir: Path,
+) -> None:
+    """Write the sessions TSV file of a single subject.
 
-            visit_code = df.loc[(df["RID"] == rid), "VISCODE"]
+    Parameters
+    ----------
+    subject_data : tuple of int and list of DataFrames
+        The subject RID and the rows of each clinical file for this subject.
 
-            for field in sessions_fields_to_read:
-                if field in list(df.columns.values) and field == "MMSCORE":
-                    mm_score = df.loc[(df["RID"] == rid), field]
-                    mm_score[mm_score == -4] = "n/a"
+    sessions_fields_to_read : list of str
+        The names of the fields to extract from the clinical files.
 
-                elif field in list(df.columns.values) and field == "CDGLOBAL":
-                    cd_global = df.loc[(df["RID"] == rid), field]
-                    cd_global[cd_global == -4] = "n/a"
+    input_path : Path
+        The path to the input folder.
 
-                elif field in list(df.columns.values) and field == "DXCURREN":
-                    dx_curren = df.loc[(df["RID"] == rid), field]
-                    dx_curren[dx_curren == -4] = "n/a"
-                    dx_curren[dx_curren == 1] = "CN"
-                    dx_curren[dx_curren == 2] = "MCI"
-                    dx_curren[dx_curren == 3] = "AD"
+    clinical_data_dir : Path
+        The path to the directory to the clinical data files.
+    """
+    rid, dataframes = subject_data
+    for df in dataframes:
+        visit_code = df["VISCODE"]
+
+        for field in sessions_fields_to_read:
+            if field in list(df.columns.values) and field == "MMSCORE":
+                mm_score = df[field].copy()
+                mm_score[mm_score == -4] = "n/a"
+
+            elif field in list(df.columns.values) and field == "CDGLOBAL":
+                cd_global = df[field].copy()
+                cd_global[cd_global == -4] = "n/a"
+
+            elif field in list(df.columns.values) and field == "DXCURREN":
+                dx_curren = (
+                    df[field].map(_DIAGNOSIS_MAPPING).fillna("n/a").astype("category")
+                )
 
-                elif field in list(df.columns.values) and field == "EXAMDATE":
-                    exam_date = df.loc[(df["RID"] == rid), field]
+            elif field in list(df.columns.values) and field == "EXAMDATE":
+                exam_date = df[field]
 
-                elif field in list(df.columns.values) and field == "PTDOB":
-                    patient_date_of_birth = df.loc[(df["RID"] == rid), field]
+            elif field in list(df.columns.values) and field == "PTDOB":
+                patient_date_of_birth = df[field]
 
-        exam_dates = _clean_exam_dates(
-            rid, exam_date.to_list(), visit_code.to_list(), clinical_data_dir
-        )
-        age = _compute_ages_at_each_exam(patient_date_of_birth.values[0], exam_dates)
-
-        visit_code[visit_code == "bl"] = "M000"
-        visit_code = visit_code.str.upper()
-
-        sessions = pd.DataFrame(
-            {
-                "months": visit_code.str[1:],
-                "age": age,
-                "MMS": mm_score,
-                "cdr_global": cd_global,
-                "diagnosis": dx_curren,
-                "examination_date": exam_dates,
-            }
-        )
-        sessions = sessions.assign(
-            session_id=lambda df: df.months.apply(lambda x: f"ses-M{int(x):03d}")
+    exam_dates = _clean_exam_dates(
+        rid, exam_date.to_list(), visit_code.to_list(), clinical_data_dir
+    )
+    age = _compute_ages_at_each_exam(patient_date_of_birth.values[0], exam_dates)
+
+    visit_code = visit_code.copy()
+    visit_code[visit_code == "bl"] = "M000"
+    visit_code = visit_code.str.upper()
+
+    sessions = pd.DataFrame(
+        {
+            "months": visit_code.str[1:],
+            "age": age,
+            "MMS": mm_score,
+            "cdr_global": cd_global,
+            "diagnosis": dx_curren,
+            "examination_date": exam_dates,
+        }
+    )
+    sessions = sessions.assign(
+        session_id=lambda df: df.months.apply(lambda x: f"ses-M{int(x):03d}")
+    )
+    cols = sessions.columns.tolist()
+    sessions = sessions[cols[-1:] + cols[:-1]]
+
+    bids_paths = input_path / f"sub-{StudyName.AIBL.value}{rid}"
+    if bids_paths.exists():
+        sessions.to_csv(
+            input_path
+            / f"sub-{StudyName.AIBL.value}{rid}"
+            / f"sub-{StudyName.AIBL.value}{rid}_sessions.tsv",
+            sep="\t",
+            index=False,
+            encoding="utf8",
         )
-        cols = sessions.columns.tolist()
-        sessions = sessions[cols[-1:] + cols[:-1]]
-
-        bids_paths = input_path / f"sub-{StudyName.AIBL.value}{rid}"
-        if bids_paths.exists():
-            sessions.to_csv(
-                input_path
-                / f"sub-{StudyName.AIBL.value}{rid}"
-                / f"sub-{StudyName.AIBL.value}{rid}_sessions.tsv",
-                sep="\t",
-                index=False,
-                encoding="utf8",
-            )
 
 
 def _clean_exam_dates(
     rid: str, exam_dates: List[str], visit_codes: List[str], clinical_data_dir: Path
 ) -> List[str]:
     """Clean the exam dates when necessary by trying to compute them from other sources."""
-    from clinica.utils.stream import cprint
-
-    exam_dates_cleaned: List[str] = []
-    for visit_code, exam_date in zip(visit_codes, exam_dates):
-        if exam_date == "-4":
-            exam_date = _find_exam_date_in_other_csv_files(
-                rid, visit_code, clinical_data_dir
-            ) or _compute_exam_date_from_baseline(visit_code, exam_dates, visit_codes)
-            if not exam_date:
-                cprint(f"No EXAMDATE for subject %{rid}, at session {visit_code}")
-                exam_date = "-4"
-        exam_dates_cleaned.append(exam_date)
+    exam_dates_cleaned = list(exam_dates)
+    missing = [i for i, exam_date in enumerate(exam_dates) if exam_date == "-4"]
+    if not missing:
+        return exam_dates_cleaned
+    alternative_exam_dates = _find_exam_dates_in_other_csv_files(rid, clinical_data_dir)
+    for i in missing:
+        visit_code = visit_codes[i]
+        exam_date = alternative_exam_dates.get(
+            visit_code
+        ) or _compute_exam_date_from_baseline(visit_code, exam_dates, visit_codes)
+        if not exam_date:
+            cprint(f"No EXAMDATE for subject %{rid}, at session {visit_code}")
+            exam_date = "-4"
+        exam_dates_cleaned[i] = exam_date
 
     return exam_dates_cleaned
 
 
-def _find_exam_date_in_other_csv_files(
-    rid: str, visit_code: str, clinical_data_dir: Path
-) -> Optional[str]:
-    """Try to find an alternative exam date by searching in other CSV files."""
+def _find_exam_dates_in_other_csv_files(
+    rid: str, clinical_data_dir: Path
+) -> Dict[str, str]:
+    """Try to find alternative exam dates by searching in other CSV files.
+
+    Returns a mapping from visit code to exam date for the provided subject.
+    """
+    exam_dates = _load_alternative_exam_dates(clinical_data_dir)
+    if rid not in exam_dates.index.get_level_values("RID"):
+        return {}
+    return exam_dates.loc[rid].to_dict()
+
+
+@lru_cache
+def _load_alternative_exam_dates(clinical_data_dir: Path) -> pd.Series:
+    """Load the exam dates of all subjects from the CSV files in which
+    an alternative exam date could be found.
+
+    The CSV files are only read once per clinical data folder during a
+    conversion, the cache being cleared when `create_sessions_tsv_file`
+    returns. The result is indexed by (RID, VISCODE) and, for a given pair,
+    the first CSV file providing a valid exam date wins.
+    """
+    exam_dates = []
     for csv_file in _get_cvs_files(clinical_data_dir):
         if "aibl_flutemeta" in csv_file:
             csv_data = pd.read_csv(
@@ -294,16 +366,21 @@ def _find_exam_date_in_other_csv_files(
             )
         else:
             csv_data = pd.read_csv(csv_file, low_memory=False)
-        exam_date = csv_data[(csv_data.RID == rid) & (csv_data.VISCODE == visit_code)]
-        if not exam_date.empty and exam_date.iloc[0].EXAMDATE != "-4":
-            return exam_date.iloc[0].EXAMDATE
-    return None
+        csv_data = csv_data[["RID", "VISCODE", "EXAMDATE"]].drop_duplicates(
+            ["RID", "VISCODE"]
+        )
+        exam_dates.append(csv_data[csv_data.EXAMDATE != "-4"])
+
+    return (
+        pd.concat(exam_dates)
+        .drop_duplicates(["RID", "VISCODE"])
+        .set_index(["RID", "VISCODE"])
+        .EXAMDATE
+    )
 
 
 def _get_cvs_files(clinical_data_dir: Path) -> List[str]:
     """Return a list of paths to CSV files in which an alternative exam date could be found."""
-    import glob
-
     return [
         glob.glob(str(clinical_data_dir / pattern))[0]
         for pattern in (
@@ -321,10 +398,6 @@ def _compute_exam_date_from_baseline(
     visit_code: str, exam_dates: List[str], visit_codes: List[str]
 ) -> Optional[str]:
     """Try to find an alternative exam date by computing the number of months from the visit code."""
-    from datetime import datetime
-
-    from dateutil.relativedelta import relativedelta
-
     baseline_index = visit_codes.index("bl")
     if baseline_index > -1:
         baseline_date = datetime.strptime(exam_dates[baseline_index], "%m/%d/%Y")
@@ -359,17 +432,10 @@ def _compute_ages_at_each_exam(
     list of float
         The ages of the patient at each exam date.
     """
-    from datetime import datetime
+    date_of_birth = pd.to_datetime(patient_date_of_birth, format="/%Y")
+    exam_dates = pd.to_datetime(pd.Series(exam_dates, dtype=str), format="%m/%d/%Y")
 
-    ages: List[float] = []
-    date_of_birth = datetime.strptime(patient_date_of_birth, "/%Y")
-
-    for exam_date in exam_dates:
-        exam_date = datetime.strptime(exam_date, "%m/%d/%Y")
-        delta = exam_date - date_of_birth
-        ages.append(round(delta.days / 365.25, 1))
-
-    return ages
+    return ((exam_dates - date_of_birth).dt.days / 365.25).round(1).tolist()
 
 
 def create_scans_tsv_file(
@@ -390,47 +456,22 @@ def create_scans_tsv_file(
     clinical_specifications_folder : Path
         The path to the folder containing the clinical specification files.
     """
-    import glob
-    from os import path
-
-    import clinica.iotools.bids_utils as bids
-
-    specifications = _load_specifications(clinical_specifications_folder, "scans.tsv")
-    scans_fields = specifications[bids.StudyName.AIBL.value]
-    field_location = specifications[f"{bids.StudyName.AIBL.value} location"]
-    scans_fields_bids = specifications["BIDS CLINICA"]
-    fields_dataset = []
-    fields_bids = []
-
-    # Keep only fields for which there are AIBL fields
-    for i in range(0, len(scans_fields)):
-        if not pd.isnull(scans_fields[i]):
-            fields_bids.append(scans_fields_bids[i])
-            fields_dataset.append(scans_fields[i])
-
-    files_to_read = []
-    sessions_fields_to_read = []
-    for i in range(0, len(scans_fields)):
-        # If the i-th field is available
-        if not pd.isnull(scans_fields[i]):
-            file_to_read_path = clinical_data_dir / field_location[i]
-            files_to_read.append(glob.glob(str(file_to_read_path))[0])
-            sessions_fields_to_read.append(scans_fields[i])
-
     bids_ids = [
-        path.basename(sub_path) for sub_path in glob.glob(str(input_path / "sub-AIBL*"))
+        sub_path.name
+        for sub_path in input_path.iterdir()
+        if sub_path.name.startswith(f"sub-{StudyName.AIBL.value}") and sub_path.is_dir()
     ]
     ses_dict = {
         bids_id: {"M000": "bl", "M018": "m18", "M036": "m36", "M054": "m54"}
         for bids_id in bids_ids
     }
-    scans_dict = bids.create_scans_dict(
+    scans = create_scans_dict(
         clinical_data_dir,
-        bids.StudyName.AIBL,
+        StudyName.AIBL,
         clinical_specifications_folder,
         bids_ids,
         "RID",
         "VISCODE",
         ses_dict,
     )
-    bids.write_scans_tsv(input_path, bids_ids, scans_dict)
+    write_scans_tsv(input_path, bids_ids, scans)
@@ -143,7 +143,7 @@ class OasisToBids(Converter):
             write_scans_tsv,
         )
 
-        scans_dict = create_scans_dict(
+        scans = create_scans_dict(
             clinical_data_dir=clinical_data_dir,
             study_name=StudyName.OASIS,
             clinical_specifications_folder=Path(__file__).parents[1] / "specifications",
@@ -152,7 +152,7 @@ class OasisToBids(Converter):
             name_column_ses="",
             ses_dict=sessions,
         )
-        write_scans_tsv(bids_dir, bids_ids, scans_dict)
+        write_scans_tsv(bids_dir, bids_ids, scans)
 
     def _create_modality_agnostic_files(self, bids_dir: Path):
         from clinica.iotools.bids_utils import StudyName, write_modality_agnostic_files
@@ -1146,12 +1146,20 @@ def check_volume_location_in_world_coordinate_system(
     import click
     import numpy as np
 
+    from clinica.utils.filemanip import map_in_threads
+
     flag_centered = True
-    list_non_centered_files = [file for file in nifti_list if not is_centered(file)]
-    if len(list_non_centered_files) > 0:
-        centers = [
-            get_world_coordinate_of_center(file) for file in list_non_centered_files
-        ]
+    # Read the header of each file only once, both to check
+    # and to report the location of its center
+    all_centers = map_in_threads(get_world_coordinate_of_center, nifti_list)
+    non_centered = [
+        (file, center)
+        for file, center in zip(nifti_list, all_centers)
+        if not _is_center_close_to_origin(center)
+    ]
+    if len(non_centered) > 0:
+        list_non_centered_files = [file for file, _ in non_centered]
+        centers = [center for _, center in non_centered]
         l2_norm = [np.linalg.norm(center, ord=2) for center in centers]
 
         # File column width : 3 spaces more than the longest string to display
@@ -1231,13 +1239,19 @@ def is_centered(nii_volume: PathLike, threshold_l2: int = 50) -> bool:
     produced segmentation is wrong (not the shape of a brain anymore)
     """
 
-    import numpy as np
+    return _is_center_close_to_origin(
+        get_world_coordinate_of_center(nii_volume), threshold_l2
+    )
+
 
-    center = get_world_coordinate_of_center(nii_volume)
+def _is_center_close_to_origin(center: ndarray, threshold_l2: int = 50) -> bool:
+    """Checks if the world coordinates of a volume center are close to the origin.
 
-    distance_from_origin = np.linalg.norm(center, ord=2)
+    See `is_centered` for the meaning of `threshold_l2`.
+    """
+    import numpy as np
 
-    return distance_from_origin < threshold_l2
+    return np.linalg.norm(center, ord=2) < threshold_l2
 
 
 def get_world_coordinate_of_center(nii_volume: PathLike) -> ndarray:
@@ -25,6 +25,18 @@ pipeline_name = "t1-freesurfer"
         "(this is not the case for other flags)."
     ),
 )
+@cli_param.option_group.option(
+    "-omp",
+    "--openmp",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help=(
+        "Number of threads used by each recon-all command. If greater than 1, "
+        "recon-all is run with the -parallel and -openmp flags so that both "
+        "hemispheres are processed concurrently."
+    ),
+)
 @cli_param.option_group.common_pipelines_options
 @cli_param.option.subjects_sessions_tsv
 @cli_param.option.working_directory
@@ -39,6 +51,7 @@ def cli(
     bids_directory: str,
     caps_directory: str,
     recon_all_args: str,
+    openmp: int = 1,
     working_directory: Optional[str] = None,
     subjects_sessions_tsv: Optional[str] = None,
     n_procs: Optional[int] = None,
@@ -64,6 +77,7 @@ def cli(
         base_dir=working_directory,
         parameters={
             "recon_all_args": recon_all_args,
+            "openmp": openmp,
             "skip_question": yes,
         },
         name=pipeline_name,
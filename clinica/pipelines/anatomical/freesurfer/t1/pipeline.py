@@ -20,22 +20,47 @@ class T1FreeSurfer(Pipeline):
     def get_processed_images(
         caps_directory: Path, subjects: List[str], sessions: List[str]
     ) -> List[str]:
-        from clinica.utils.filemanip import extract_image_ids
         from clinica.utils.input_files import T1_FS_DESTRIEUX
-        from clinica.utils.inputs import clinica_file_reader
+        from clinica.utils.inputs import (
+            _format_errors,
+            check_caps_folder,
+            insensitive_glob,
+        )
+        from clinica.utils.stream import cprint
 
         image_ids: List[str] = []
         if caps_directory.is_dir():
-            t1_freesurfer_files, _ = clinica_file_reader(
-                subjects, sessions, caps_directory, T1_FS_DESTRIEUX, False
-            )
-            image_ids = extract_image_ids(t1_freesurfer_files)
+            check_caps_folder(caps_directory)
+            # Glob the segmentation at its fixed depth for the requested
+            # (subject, session) pairs only, instead of recursively globbing
+            # their whole session folder through clinica_file_reader
+            errors = []
+            for subject, session in zip(subjects, sessions):
+                found = insensitive_glob(
+                    str(
+                        caps_directory
+                        / "subjects"
+                        / subject
+                        / session
+                        / T1_FS_DESTRIEUX["pattern"]
+                    )
+                )
+                if len(found) == 1:
+                    image_ids.append(Path(found[0]).parents[1].name)
+                elif len(found) > 1:
+                    errors.append(
+                        f"\t*  ({subject} | {session}): More than 1 file found:\n"
+                        + "".join(f"\t\t{path}\n" for path in found)
+                    )
+            if errors:
+                cprint(msg=_format_errors(errors, T1_FS_DESTRIEUX), lvl="warning")
         return image_ids
 
     def _check_pipeline_parameters(self) -> None:
         """Check pipeline parameters."""
         from clinica.utils.stream import cprint
 
+        self.parameters.setdefault("openmp", 1)
         if "-dontrun" in self.parameters["recon_all_args"].split(" "):
             cprint(
                 msg=(
@@ -92,10 +117,7 @@ class T1FreeSurfer(Pipeline):
             check_volume_location_in_world_coordinate_system,
         )
         from clinica.utils.exceptions import ClinicaException
-        from clinica.utils.filemanip import (
-            extract_subjects_sessions_from_filename,
-            save_participants_sessions,
-        )
+        from clinica.utils.filemanip import save_participants_sessions
         from clinica.utils.input_files import T1W_NII
         from clinica.utils.inputs import clinica_file_reader
         from clinica.utils.stream import cprint
@@ -122,13 +144,14 @@ class T1FreeSurfer(Pipeline):
                 )
             else:
                 cprint(msg="Image(s) will be ignored by Clinica.", lvl="warning")
-                input_ids = [
-                    f"{p_id}_{s_id}" for p_id, s_id in zip(self.subjects, self.sessions)
+                processed_ids = frozenset(processed_ids)
+                to_process = [
+                    (p_id, s_id)
+                    for p_id, s_id in zip(self.subjects, self.sessions)
+                    if f"{p_id}_{s_id}" not in processed_ids
                 ]
-                to_process_ids = list(set(input_ids) - set(processed_ids))
-                self.subjects, self.sessions = extract_subjects_sessions_from_filename(
-                    to_process_ids
-                )
+                self.subjects = [p_id for p_id, _ in to_process]
+                self.sessions = [s_id for _, s_id in to_process]
 
         t1w_files, error_message = clinica_file_reader(
             self.subjects,
@@ -229,6 +252,12 @@ class T1FreeSurfer(Pipeline):
         # FreeSurfer segmentation will be in <subjects_dir>/<image_id>/
         recon_all = npe.Node(interface=ReconAll(), name="1-SegmentationReconAll")
         recon_all.inputs.directive = "all"
+        if self.parameters["openmp"] > 1:
+            # Process both hemispheres concurrently with OpenMP threads
+            # and let the MultiProc plugin account for these threads
+            recon_all.inputs.parallel = True
+            recon_all.inputs.openmp = self.parameters["openmp"]
+            recon_all.n_procs = self.parameters["openmp"]
 
         # Generate TSV files containing a summary of the regional statistics
         # in <subjects_dir>/regional_measures
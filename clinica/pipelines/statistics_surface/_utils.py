@@ -230,6 +230,7 @@ def run_clinica_surfstat(
         surface_file=pipeline_parameters["custom_file"],
         fwhm=pipeline_parameters["full_width_at_half_maximum"],
         cluster_threshold=pipeline_parameters["cluster_threshold"],
+        n_threads=pipeline_parameters["n_threads"],
     )
     return output_dir
 
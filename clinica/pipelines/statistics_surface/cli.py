@@ -147,6 +147,8 @@ def cli(
         "measure_label": measure_label,
         # Advanced arguments (i.e. tricky parameters)
         "cluster_threshold": cluster_threshold,
+        # Cap the BLAS threads of the GLM fit to the requested number of CPUs
+        "n_threads": n_procs,
     }
 
     pipeline = StatisticsSurface(
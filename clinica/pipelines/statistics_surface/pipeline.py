@@ -42,6 +42,7 @@ class StatisticsSurface(Pipeline):
         )
         self.parameters.setdefault("measure_label", "ct")
         self.parameters.setdefault("cluster_threshold", 0.001)
+        self.parameters.setdefault("n_threads", None)
         self.parameters.setdefault("glm_type", None)
 
         if self.parameters["orig_input_data"] == "pet-surface":
@@ -1,6 +1,14 @@
 from pathlib import Path
 from typing import Optional
 
+from ._utils import (
+    build_thickness_array,
+    check_fsaverage_files,
+    get_average_surface,
+    get_t1_freesurfer_custom_file_template,
+    read_and_check_tsv_file,
+)
+
 
 def clinica_surfstat(
     input_dir: Path,
@@ -17,6 +25,7 @@ def clinica_surfstat(
     threshold_uncorrected_pvalue: Optional[float] = 0.001,
     threshold_corrected_pvalue: Optional[float] = 0.05,
     cluster_threshold: Optional[float] = 0.001,
+    n_threads: Optional[int] = None,
 ) -> None:
     """This function mimics the previous function `clinica_surfstat`
     written in MATLAB and relying on the MATLAB package SurfStat.
@@ -124,25 +133,27 @@ def clinica_surfstat(
 
     cluster_threshold : float, optional
         The threshold to be used to declare clusters as significant. Default=0.05.
+
+    n_threads : int, optional
+        The maximum number of threads used by the BLAS libraries when fitting
+        the GLM model. Use it to avoid oversubscribing the CPUs when several
+        models are fitted concurrently. If None, the default number of threads
+        of the BLAS libraries is used. Default=None.
     """
-    from ._utils import (
-        build_thickness_array,
-        get_average_surface,
-        get_t1_freesurfer_custom_file_template,
-        read_and_check_tsv_file,
-    )
+    # The models rely on BrainStat which is slow to import, only do it when needed
     from .models import GLMModelType, create_glm_model
 
     df_subjects = read_and_check_tsv_file(tsv_file)
+    # Fail early, before loading all the surface files, if the templates are missing
+    fsaverage_path = freesurfer_home / "subjects" / "fsaverage" / "surf"
+    check_fsaverage_files(fsaverage_path)
     surface_file: str = surface_file or get_t1_freesurfer_custom_file_template(
         input_dir
     )
     thickness = build_thickness_array(input_dir, surface_file, df_subjects, fwhm)
 
     # Load average surface template
-    average_surface, average_mesh = get_average_surface(
-        freesurfer_home / "subjects" / "fsaverage" / "surf"
-    )
+    average_surface, average_mesh = get_average_surface(fsaverage_path)
 
     # Build and run GLM model
     glm_model = create_glm_model(
@@ -157,6 +168,13 @@ def clinica_surfstat(
         threshold_corrected_pvalue=threshold_corrected_pvalue,
         cluster_threshold=cluster_threshold,
     )
-    glm_model.fit(thickness, average_surface)
+    if n_threads is None:
+        glm_model.fit(thickness, average_surface)
+    else:
+        # threadpoolctl is only needed to cap the BLAS threads
+        from threadpoolctl import threadpool_limits
+
+        with threadpool_limits(limits=n_threads, user_api="blas"):
+            glm_model.fit(thickness, average_surface)
     glm_model.save_results(output_dir, ["json", "mat"])
     glm_model.plot_results(output_dir, ["nilearn_plot_surf_stat_map"], average_mesh)
@@ -1,9 +1,10 @@
 """This file contains functions for loading data from disk
 and performing some checks on them.
 """
+from functools import lru_cache
 from os import PathLike
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Callable, Dict, Tuple
 
 import numpy as np
 import pandas as pd
@@ -18,6 +19,7 @@ __all__ = [
     "get_t1_freesurfer_custom_file_template",
     "build_thickness_array",
     "get_average_surface",
+    "check_fsaverage_files",
 ]
 
 
@@ -35,15 +37,14 @@ def read_and_check_tsv_file(tsv_file: PathLike) -> pd.DataFrame:
         DataFrame obtained from the file.
     """
     try:
-        return pd.read_csv(tsv_file, sep="\t").set_index(
-            [TSV_FIRST_COLUMN, TSV_SECOND_COLUMN]
-        )
+        tsv_data = pd.read_csv(tsv_file, sep="\t")
     except FileNotFoundError:
         raise FileNotFoundError(f"File {tsv_file} does not exist.")
-    except KeyError:
+    if not {TSV_FIRST_COLUMN, TSV_SECOND_COLUMN}.issubset(tsv_data.columns):
         raise ValueError(
             f"The TSV data should have at least two columns: {TSV_FIRST_COLUMN} and {TSV_SECOND_COLUMN}"
         )
+    return tsv_data.set_index([TSV_FIRST_COLUMN, TSV_SECOND_COLUMN])
 
 
 T1_FREESURFER_TEMPLATE_PATH_FROM_CAPS_ROOT = (
@@ -68,6 +69,46 @@ def get_t1_freesurfer_custom_file_template(base_dir: PathLike) -> str:
     return str(base_dir) + T1_FREESURFER_TEMPLATE_PATH_FROM_CAPS_ROOT
 
 
+def _compile_surface_file_template(
+    input_dir: Path, surface_file: str, fwhm: float
+) -> Callable[[str, str, str], str]:
+    """Turn the surface file template into a function of the subject, session and hemisphere.
+
+    Parameters
+    ----------
+    input_dir : Path
+        Input directory.
+
+    surface_file : str
+        Template for the path to the surface file of interest.
+
+    fwhm : float
+        Smoothing parameter only used to retrieve the right surface file.
+
+    Returns
+    -------
+    Callable[[str, str, str], str] :
+        Function returning the path to the surface file of the
+        provided subject, session, and hemisphere.
+    """
+    import os
+
+    # Join the input directory to the template once rather than building a Path
+    # for every file. The template is used as is when it is an absolute path.
+    if not Path(surface_file).is_absolute():
+        surface_file = os.path.join(str(input_dir).replace("%", "%%"), surface_file)
+
+    def get_surface_file_path(subject: str, session: str, hemi: str) -> str:
+        return surface_file % {
+            "subject": subject,
+            "session": session,
+            "fwhm": fwhm,
+            "hemi": hemi,
+        }
+
+    return get_surface_file_path
+
+
 def build_thickness_array(
     input_dir: Path,
     surface_file: str,
@@ -94,25 +135,51 @@ def build_thickness_array(
     -------
     thickness : np.ndarray
         Cortical thickness. Hemispheres and subjects are stacked.
+        Values keep the precision of the surface files (at least float32).
+        The GLM model promotes them to float64 when computing the statistics.
     """
     from nibabel.freesurfer.mghformat import load
 
-    thickness = []
-    for idx, row in df.iterrows():
-        subject, session = idx
-        parts = []
-        for hemi in ("lh", "rh"):
-            query = {"subject": subject, "session": session, "fwhm": fwhm, "hemi": hemi}
-            surface_file_path = str(input_dir / (surface_file % query))
-            parts.append(load(surface_file_path).get_fdata())
-        combined = np.vstack(parts)
-        thickness.append(combined.flatten())
-    thickness = np.vstack(thickness)
-    if thickness.shape[0] != len(df):
-        raise ValueError(
-            f"Unexpected shape for thickness array : {thickness.shape}. "
-            f"Expected {len(df)} rows."
-        )
+    from clinica.utils.filemanip import map_in_threads
+
+    get_surface_file_path = _compile_surface_file_template(
+        input_dir, surface_file, fwhm
+    )
+    surface_file_paths = [
+        [get_surface_file_path(subject, session, hemi) for hemi in ("lh", "rh")]
+        for subject, session in df.index
+    ]
+    if len(surface_file_paths) == 0:
+        raise ValueError("Cannot build the thickness array from an empty DataFrame.")
+    # Hemispheres are stacked in a single pre-allocated array of shape
+    # (n_subjects, n_vertices_lh + n_vertices_rh) filled row by row, such that
+    # it always has one row per subject and no final stacking copy is needed.
+    # Thickness is stored as float32 in the surface files, keep this precision
+    # rather than upcasting to float64 which would double the memory footprint.
+    lh_header, rh_header = (load(path).header for path in surface_file_paths[0])
+    n_vertices_lh = int(np.prod(lh_header.get_data_shape()))
+    n_vertices_rh = int(np.prod(rh_header.get_data_shape()))
+    thickness = np.empty(
+        (len(df), n_vertices_lh + n_vertices_rh),
+        dtype=np.result_type(
+            lh_header.get_data_dtype(), rh_header.get_data_dtype(), np.float32
+        ),
+    )
+
+    def _fill_row(row: int) -> None:
+        # Copy the memory-mapped data straight into the output row rather
+        # than materializing an intermediate float64 array with get_fdata
+        for path, hemi_thickness in zip(
+            surface_file_paths[row],
+            (thickness[row, :n_vertices_lh], thickness[row, n_vertices_lh:]),
+        ):
+            np.copyto(
+                hemi_thickness,
+                np.asarray(load(path, mmap=True).dataobj).ravel(),
+                casting="same_kind",
+            )
+
+    map_in_threads(_fill_row, range(len(df)))
     return thickness
 
 
@@ -148,21 +215,16 @@ def get_average_surface(fsaverage_path: Path) -> Tuple[Dict, Mesh]:
     average_mesh : nilearn.surface.Mesh
         Average mesh as a Nilearn Mesh object.
     """
-    import copy
-
-    from nilearn.surface import Mesh, load_surf_mesh
-
-    meshes = [
-        load_surf_mesh(str(fsaverage_path / f"{hemi}.pial")) for hemi in ("lh", "rh")
-    ]
-    coordinates = np.vstack([mesh.coordinates for mesh in meshes])
-    faces = np.vstack(
-        [meshes[0].faces, meshes[1].faces + meshes[0].coordinates.shape[0]]
-    )
-    average_mesh = Mesh(
-        coordinates=coordinates,
-        faces=copy.deepcopy(faces),
+    fsaverage_path = Path(fsaverage_path).resolve()
+    # Files are part of the cache key such that a modified template is reloaded
+    coordinates, faces = _load_fsaverage(
+        str(fsaverage_path),
+        tuple(
+            (stat.st_size, stat.st_mtime_ns)
+            for stat in (path.stat() for path in check_fsaverage_files(fsaverage_path))
+        ),
     )
+    average_mesh = Mesh(coordinates=coordinates, faces=faces)
     ##################
     # UGLY HACK !!! Need investigation
     ##################
@@ -170,10 +232,69 @@ def get_average_surface(fsaverage_path: Path) -> Tuple[Dict, Mesh]:
     # with negative values in bincount in Brainstat.
     # Not sure, but might be a bug in BrainStat...
     #
-    faces += 1
+    faces = faces + 1
     #################
     average_surface = {
         "coord": coordinates,
         "tri": faces,
     }
     return average_surface, average_mesh
+
+
+def check_fsaverage_files(fsaverage_path: Path) -> Tuple[Path, Path]:
+    """Check that the pial surfaces of the fsaverage templates exist.
+
+    Parameters
+    ----------
+    fsaverage_path : Path
+        Path to the fsaverage templates.
+
+    Returns
+    -------
+    Tuple[Path, Path] :
+        The paths to the left and right hemisphere pial surfaces.
+
+    Raises
+    ------
+    FileNotFoundError
+        If one of the pial surfaces cannot be found.
+    """
+    pial_files = tuple(fsaverage_path / f"{hemi}.pial" for hemi in ("lh", "rh"))
+    for pial_file in pial_files:
+        if not pial_file.is_file():
+            raise FileNotFoundError(
+                f"The fsaverage template {pial_file} could not be found. "
+                "Please check your FreeSurfer installation."
+            )
+    return pial_files
+
+
+@lru_cache(maxsize=4)
+def _load_fsaverage(
+    fsaverage_path: str, files_signature: Tuple
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Load the coordinates and faces of both hemispheres of the fsaverage templates.
+
+    The meshes are only parsed once per path and `files_signature` (the size
+    and modification time of the files). Since the returned arrays are shared
+    between calls, they are flagged as read-only.
+    """
+    from nilearn.surface import load_surf_mesh
+
+    meshes = [
+        load_surf_mesh(str(Path(fsaverage_path) / f"{hemi}.pial"))
+        for hemi in ("lh", "rh")
+    ]
+    coordinates = np.vstack([mesh.coordinates for mesh in meshes])
+    # Write the right hemisphere faces, shifted by the number of vertices
+    # of the left hemisphere, straight into the stacked array
+    n_lh_faces = meshes[0].faces.shape[0]
+    faces = np.empty(
+        (n_lh_faces + meshes[1].faces.shape[0], meshes[0].faces.shape[1]),
+        dtype=np.result_type(meshes[0].faces, meshes[1].faces),
+    )
+    faces[:n_lh_faces] = meshes[0].faces
+    np.add(meshes[1].faces, meshes[0].coordinates.shape[0], out=faces[n_lh_faces:])
+    coordinates.setflags(write=False)
+    faces.setflags(write=False)
+    return coordinates, faces
@@ -32,25 +32,52 @@ def _get_substitutions_datasink(bids_image_id: str, suffix: str) -> list:
     substitutions : List of tuples of str
         List of length 3 containing the substitutions to perform.
     """
-    if bids_image_id.endswith(f"_{suffix}"):
-        bids_image_id_without_suffix = bids_image_id.removesuffix(f"_{suffix}")
-    else:
-        raise ValueError(
-            f"bids image ID {bids_image_id} should end with provided {suffix}."
-        )
+    return _get_substitutions_datasink_batch([bids_image_id], suffix)[0]
+
+
+def _get_substitutions_datasink_batch(bids_image_ids: list, suffix: str) -> list:
+    """Return file name substitutions for renaming several images.
+
+    Parameters
+    ----------
+    bids_image_ids : List of str
+        The original image BIDS file names without the extension.
+        See `_get_substitutions_datasink`.
+
+    suffix : str
+        The suffix to use for the new files.
+
+    Returns
+    -------
+    substitutions : List of lists of tuples of str
+        For each image, the list of length 3 containing the substitutions to perform.
+    """
+    for bids_image_id in bids_image_ids:
+        if not bids_image_id.endswith(f"_{suffix}"):
+            raise ValueError(
+                f"bids image ID {bids_image_id} should end with provided {suffix}."
+            )
+    bids_image_ids_without_suffix = [
+        bids_image_id.removesuffix(f"_{suffix}") for bids_image_id in bids_image_ids
+    ]
     return [
-        (
-            f"{bids_image_id}Warped_cropped.nii.gz",
-            f"{bids_image_id_without_suffix}_space-MNI152NLin2009cSym_desc-Crop_res-1x1x1_{suffix}.nii.gz",
-        ),
-        (
-            f"{bids_image_id}0GenericAffine.mat",
-            f"{bids_image_id_without_suffix}_space-MNI152NLin2009cSym_res-1x1x1_affine.mat",
-        ),
-        (
-            f"{bids_image_id}Warped.nii.gz",
-            f"{bids_image_id_without_suffix}_space-MNI152NLin2009cSym_res-1x1x1_{suffix}.nii.gz",
-        ),
+        [
+            (
+                f"{bids_image_id}Warped_cropped.nii.gz",
+                f"{bids_image_id_without_suffix}_space-MNI152NLin2009cSym_desc-Crop_res-1x1x1_{suffix}.nii.gz",
+            ),
+            (
+                f"{bids_image_id}0GenericAffine.mat",
+                f"{bids_image_id_without_suffix}_space-MNI152NLin2009cSym_res-1x1x1_affine.mat",
+            ),
+            (
+                f"{bids_image_id}Warped.nii.gz",
+                f"{bids_image_id_without_suffix}_space-MNI152NLin2009cSym_res-1x1x1_{suffix}.nii.gz",
+            ),
+        ]
+        for bids_image_id, bids_image_id_without_suffix in zip(
+            bids_image_ids, bids_image_ids_without_suffix
+        )
     ]
 
 
@@ -1,11 +1,37 @@
-from typing import List
-
-from nipype import config
+from pathlib import Path
+from typing import List, Sequence
 
 from clinica.pipelines.engine import Pipeline
 
-cfg = dict(execution={"parameterize_dirs": False})
-config.update_config(cfg)
+# Renaming of the SPM outputs written to CAPS
+_REGEXP_SUBSTITUTIONS = [
+    (r"(.*)c1(sub-.*)(\.nii(\.gz)?)$", r"\1\2_segm-graymatter\3"),
+    (r"(.*)c2(sub-.*)(\.nii(\.gz)?)$", r"\1\2_segm-whitematter\3"),
+    (r"(.*)c3(sub-.*)(\.nii(\.gz)?)$", r"\1\2_segm-csf\3"),
+    (r"(.*)c4(sub-.*)(\.nii(\.gz)?)$", r"\1\2_segm-bone\3"),
+    (r"(.*)c5(sub-.*)(\.nii(\.gz)?)$", r"\1\2_segm-softtissue\3"),
+    (r"(.*)c6(sub-.*)(\.nii(\.gz)?)$", r"\1\2_segm-background\3"),
+    (r"(.*)(/native_space/sub-.*)(\.nii(\.gz)?)$", r"\1\2_probability\3"),
+    (
+        r"(.*)(/([a-z]+)_deformation_field/)i?y_(sub-.*)(\.nii(\.gz)?)$",
+        r"\1/normalized_space/\4_target-Ixi549Space_transformation-\3_deformation\5",
+    ),
+    (
+        r"(.*)(/t1_mni/)w(sub-.*)_T1w(\.nii(\.gz)?)$",
+        r"\1/normalized_space/\3_space-Ixi549Space_T1w\4",
+    ),
+    (
+        r"(.*)(/modulated_normalized/)mw(sub-.*)(\.nii(\.gz)?)$",
+        r"\1/normalized_space/\3_space-Ixi549Space_modulated-on_probability\4",
+    ),
+    (
+        r"(.*)(/normalized/)w(sub-.*)(\.nii(\.gz)?)$",
+        r"\1/normalized_space/\3_space-Ixi549Space_modulated-off_probability\4",
+    ),
+    (r"(.*/dartel_input/)r(sub-.*)(\.nii(\.gz)?)$", r"\1\2_dartelinput\3"),
+    # Will remove trait_added empty folder
+    (r"trait_added", r""),
+]
 
 
 class T1VolumeTissueSegmentation(Pipeline):
@@ -15,6 +41,24 @@ class T1VolumeTissueSegmentation(Pipeline):
         A clinica pipeline object containing the T1VolumeTissueSegmentation pipeline.
     """
 
+    def get_processed_images(
+        self, caps_directory: Path, subjects: List[str], sessions: List[str]
+    ) -> List[str]:
+        """Extract the image IDs for which the outputs of this run are found in `caps_directory`.
+
+        The expected outputs depend on the tissues and warped maps requested
+        in the pipeline parameters.
+        """
+        return _get_processed_images(
+            caps_directory,
+            subjects,
+            sessions,
+            tissue_classes=self.parameters["tissue_classes"],
+            dartel_tissues=self.parameters["dartel_tissues"],
+            save_warped_unmodulated=self.parameters["save_warped_unmodulated"],
+            save_warped_modulated=self.parameters["save_warped_modulated"],
+        )
+
     def _check_custom_dependencies(self) -> None:
         """Check dependencies that can not be listed in the `info.json` file."""
         pass
@@ -141,6 +185,10 @@ class T1VolumeTissueSegmentation(Pipeline):
 
         use_spm_standalone_if_available()
 
+        # Only disable the parameterized node directories for this workflow
+        # rather than in the global nipype configuration
+        self.config["execution"]["parameterize_dirs"] = False
+
         # Get <subject_id> (e.g. sub-CLNC01_ses-M000) from input_node
         # and print begin message
         # =======================
@@ -233,34 +281,7 @@ class T1VolumeTissueSegmentation(Pipeline):
         write_node = npe.Node(name="WriteCAPS", interface=nio.DataSink())
         write_node.inputs.base_directory = str(self.caps_directory)
         write_node.inputs.parameterization = False
-        write_node.inputs.regexp_substitutions = [
-            (r"(.*)c1(sub-.*)(\.nii(\.gz)?)$", r"\1\2_segm-graymatter\3"),
-            (r"(.*)c2(sub-.*)(\.nii(\.gz)?)$", r"\1\2_segm-whitematter\3"),
-            (r"(.*)c3(sub-.*)(\.nii(\.gz)?)$", r"\1\2_segm-csf\3"),
-            (r"(.*)c4(sub-.*)(\.nii(\.gz)?)$", r"\1\2_segm-bone\3"),
-            (r"(.*)c5(sub-.*)(\.nii(\.gz)?)$", r"\1\2_segm-softtissue\3"),
-            (r"(.*)c6(sub-.*)(\.nii(\.gz)?)$", r"\1\2_segm-background\3"),
-            (r"(.*)(/native_space/sub-.*)(\.nii(\.gz)?)$", r"\1\2_probability\3"),
-            (
-                r"(.*)(/([a-z]+)_deformation_field/)i?y_(sub-.*)(\.nii(\.gz)?)$",
-                r"\1/normalized_space/\4_target-Ixi549Space_transformation-\3_deformation\5",
-            ),
-            (
-                r"(.*)(/t1_mni/)w(sub-.*)_T1w(\.nii(\.gz)?)$",
-                r"\1/normalized_space/\3_space-Ixi549Space_T1w\4",
-            ),
-            (
-                r"(.*)(/modulated_normalized/)mw(sub-.*)(\.nii(\.gz)?)$",
-                r"\1/normalized_space/\3_space-Ixi549Space_modulated-on_probability\4",
-            ),
-            (
-                r"(.*)(/normalized/)w(sub-.*)(\.nii(\.gz)?)$",
-                r"\1/normalized_space/\3_space-Ixi549Space_modulated-off_probability\4",
-            ),
-            (r"(.*/dartel_input/)r(sub-.*)(\.nii(\.gz)?)$", r"\1\2_dartelinput\3"),
-            # Will remove trait_added empty folder
-            (r"trait_added", r""),
-        ]
+        write_node.inputs.regexp_substitutions = _REGEXP_SUBSTITUTIONS
 
         self.connect(
             [
@@ -336,3 +357,84 @@ class T1VolumeTissueSegmentation(Pipeline):
                     ),
                 ]
             )
+
+
+def _list_segmentation_files(session_dir: Path) -> List[str]:
+    """List the files of the SPM segmentation folder of a session in a single walk.
+
+    Paths are relative to `session_dir` such that they can be matched
+    against the patterns of `clinica.utils.input_files`.
+    """
+    import os
+
+    segmentation_dir = session_dir / "t1" / "spm" / "segmentation"
+    return [
+        os.path.relpath(os.path.join(root, filename), session_dir)
+        for root, _, filenames in os.walk(segmentation_dir)
+        for filename in filenames
+    ]
+
+
+def _get_processed_images(
+    caps_directory: Path,
+    subjects: List[str],
+    sessions: List[str],
+    tissue_classes: Sequence[int] = (1, 2, 3),
+    dartel_tissues: Sequence[int] = (1, 2, 3),
+    save_warped_unmodulated: bool = True,
+    save_warped_modulated: bool = False,
+) -> List[str]:
+    """Extract the image IDs for which the tissue maps are found in `caps_directory`.
+
+    An image is considered processed when the DARTEL inputs of `dartel_tissues`
+    as well as the tissue maps of `tissue_classes` in native space and, depending
+    on `save_warped_unmodulated` and `save_warped_modulated`, in MNI space were
+    written. The segmentation folder of each image is listed only once and
+    the file patterns are matched against this listing.
+    """
+    from fnmatch import fnmatch
+
+    from clinica.utils.filemanip import map_in_threads
+    from clinica.utils.input_files import (
+        t1_volume_dartel_input_tissue,
+        t1_volume_native_tpm,
+        t1_volume_native_tpm_in_mni,
+    )
+
+    patterns = [
+        t1_volume_dartel_input_tissue(tissue)["pattern"] for tissue in dartel_tissues
+    ]
+    patterns.extend(
+        t1_volume_native_tpm(tissue)["pattern"] for tissue in tissue_classes
+    )
+    modulations = [
+        modulation
+        for modulation, is_saved in (
+            (False, save_warped_unmodulated),
+            (True, save_warped_modulated),
+        )
+        if is_saved
+    ]
+    patterns.extend(
+        t1_volume_native_tpm_in_mni(tissue, modulation)["pattern"]
+        for tissue in tissue_classes
+        for modulation in modulations
+    )
+    image_ids = [f"{subject}_{session}" for subject, session in zip(subjects, sessions)]
+    session_dirs = [
+        Path(caps_directory) / "subjects" / subject / session
+        for subject, session in zip(subjects, sessions)
+    ]
+    listings = dict(
+        zip(image_ids, map_in_threads(_list_segmentation_files, session_dirs))
+    )
+    visits = [
+        {
+            image_id
+            for image_id, files in listings.items()
+            if any(fnmatch(f, str(Path(pattern))) for f in files)
+        }
+        for pattern in patterns
+    ]
+    processed = set.intersection(*visits) if visits else set()
+    return [image_id for image_id in listings if image_id in processed]
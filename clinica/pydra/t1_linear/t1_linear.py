@@ -1,6 +1,6 @@
 import typing as ty
 from os import PathLike
-from pathlib import Path, PurePath
+from pathlib import PurePath
 
 import pydra
 from nipype.interfaces.ants import N4BiasFieldCorrection, RegistrationSynQuick
@@ -16,11 +16,19 @@ registration_syn_quick = RegistrationSynQuick(transform_type="a")
 
 @task
 @annotate({"return": {"cropped_image": PurePath}})
-def crop_image_task(input_image: PathLike, output_dir: PathLike) -> PurePath:
+def crop_image_task(
+    input_image: PathLike, output_dir: ty.Optional[PathLike] = None
+) -> PurePath:
+    import tempfile
     from pathlib import Path
 
     from clinica.utils.image import crop_nifti
 
+    # Resolve the output folder when the task runs, such that each
+    # split element writes its cropped image to its own folder
+    if output_dir is None:
+        output_dir = tempfile.mkdtemp(prefix="crop_image_", dir=Path.cwd())
+
     return crop_nifti(Path(input_image), Path(output_dir))
 
 
@@ -72,7 +80,6 @@ def build_core_workflow(name: str = "core", parameters={}) -> Workflow:
             name="crop_image",
             interface=crop_image_task,
             input_image=wf.registration_syn_quick.lzout.warped_image,
-            output_dir=Path.cwd(),
         )
     )
 
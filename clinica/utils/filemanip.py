@@ -1,6 +1,6 @@
 from os import PathLike
 from pathlib import Path
-from typing import Callable, List, Optional, Union
+from typing import Any, Callable, Iterable, List, Optional, Union
 
 __all__ = [
     "UserProvidedPath",
@@ -14,6 +14,7 @@ __all__ = [
     "get_parent",
     "get_subject_id",
     "load_volume",
+    "map_in_threads",
     "save_participants_sessions",
     "unzip_nii",
     "zip_nii",
@@ -142,6 +143,17 @@ def _zip_unzip_nii(in_file: str, same_dir: bool, compress: bool):
     new_ext = ext + ".gz" if compress else ext[:-3]
     out_file = abspath(join(orig_dir if same_dir else getcwd(), base + new_ext))
 
+    if pigz := shutil.which("pigz" if compress else "unpigz"):
+        # pigz deflates blocks in parallel threads, with the same compression
+        # level as the gzip module. unpigz inflates in the main thread but
+        # offloads reading, writing and the CRC computation to other threads
+        import subprocess
+
+        options = ["-c", "-9"] if compress else ["-c"]
+        with open(out_file, "wb") as f_out:
+            subprocess.run([pigz, *options, str(in_file)], stdout=f_out, check=True)
+        return out_file
+
     outer = open if compress else gzip.open
     inner = gzip.open if compress else open
     with outer(in_file, "rb") as f_in:
@@ -216,6 +228,7 @@ def save_participants_sessions(
         If provided `participant_ids` and `session_ids` do not have
         the same length.
     """
+    import os
     from pathlib import Path
 
     import pandas as pd
@@ -237,9 +250,14 @@ def save_participants_sessions(
             "session_id": session_ids,
         }
     )
+    # Write to a temporary file which is then atomically moved in place
+    # such that an interrupted run never leaves a partially written file
+    tmp_file = tsv_file.with_name(f".{out_file}.{os.getpid()}.tmp")
     try:
-        data.to_csv(tsv_file, sep="\t", index=False, encoding="utf-8")
+        data.to_csv(tmp_file, sep="\t", index=False, encoding="utf-8")
+        os.replace(tmp_file, tsv_file)
     except Exception as e:
+        tmp_file.unlink(missing_ok=True)
         cprint(msg=f"Impossible to save {out_file} with pandas", lvl="error")
         raise e
 
@@ -610,3 +628,42 @@ def delete_directories_task(directories: list) -> None:
     from clinica.utils.filemanip import delete_directories  # noqa
 
     return delete_directories(directories)
+
+
+def map_in_threads(
+    function: Callable,
+    *iterables: Iterable,
+    max_workers: Optional[int] = None,
+) -> List[Any]:
+    """Apply `function` to the items of `iterables` in a pool of threads.
+
+    This is meant for I/O bound work, such as reading image headers or
+    listing folders, during which the GIL is released. One thread is
+    started per item, up to `max_workers` threads.
+
+    Parameters
+    ----------
+    function : Callable
+        The function to apply. It takes one argument per iterable.
+
+    iterables : Iterable
+        The arguments of the calls to `function`, as for `map`.
+
+    max_workers : int, optional
+        The maximum number of threads.
+        Default=32, which is the upper bound of the default
+        of `concurrent.futures.ThreadPoolExecutor`.
+
+    Returns
+    -------
+    list :
+        The results of the calls to `function`, in the order of the items.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    iterables = [list(iterable) for iterable in iterables]
+    n_items = min((len(iterable) for iterable in iterables), default=0)
+    if n_items == 0:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers or 32, n_items)) as executor:
+        return list(executor.map(function, *iterables))
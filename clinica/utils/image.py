@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from os import PathLike
 from pathlib import Path
 from typing import Callable, Optional, Tuple, Union
@@ -48,18 +49,16 @@ def compute_aggregated_volume(
     np.ndarray:
         The 3D volume data array obtained from the aggregation.
     """
-    volumes = np.array(nib.four_to_three(nib.load(image_filename)))
-    if volumes_to_keep is None:
-        volumes_to_keep = volumes
-    else:
-        volumes_to_keep = volumes[volumes_to_keep]
-    data = [
-        volume.get_fdata(dtype="float32").astype(np.float32)
-        for volume in volumes_to_keep
-    ]
+    image = nib.load(image_filename)
+    if len(image.shape) != 4:
+        raise ValueError("Expecting four dimensions")
+    # Read the 4D data once rather than building one image per volume
+    data = np.asarray(image.dataobj, dtype=np.float32)
+    if volumes_to_keep is not None:
+        data = data[..., volumes_to_keep]
     if aggregator is None:
-        return np.stack(data, axis=-1)
-    return aggregator(data, axis=0)
+        return data
+    return aggregator(data, axis=-1)
 
 
 def get_new_image_like(old_image: PathLike, new_image_data: np.ndarray) -> Nifti1Image:
@@ -78,13 +77,19 @@ def get_new_image_like(old_image: PathLike, new_image_data: np.ndarray) -> Nifti
     Nifti1Image :
         The new image.
     """
-    old_img = nib.load(old_image)
-    hdr = old_img.header.copy()
+    return _get_new_image_like_from_image(nib.load(old_image), new_image_data)
+
+
+def _get_new_image_like_from_image(
+    old_image: Nifti1Image, new_image_data: np.ndarray
+) -> Nifti1Image:
+    """Builds a new Nifti1Image from the header and affine of an already loaded image."""
+    hdr = old_image.header.copy()
     hdr.set_data_shape(new_image_data.shape)
     hdr.set_xyzt_units("mm")
     hdr.set_data_dtype(np.float32)
 
-    return nib.Nifti1Image(new_image_data, old_img.affine, hdr)
+    return nib.Nifti1Image(new_image_data, old_image.affine, hdr)
 
 
 def merge_nifti_images_in_time_dimension(
@@ -112,11 +117,10 @@ def merge_nifti_images_in_time_dimension(
     """
     import os
 
-    images = _check_existence(images)
+    images = tuple(nib.load(image) for image in _check_existence(images))
     out_file = out_file or os.path.abspath("merged_files.nii.gz")
-    volumes = _check_volumes_from_images(images)
-    merged_volume = np.concatenate(volumes, axis=-1)
-    merged_image = get_new_image_like(images[0], merged_volume)
+    merged_volume = _merge_volumes_from_images(images)
+    merged_image = _get_new_image_like_from_image(images[0], merged_volume)
     nib.save(merged_image, out_file)
 
     return out_file
@@ -135,22 +139,41 @@ def _check_existence(filenames: Tuple[PathLike, ...]) -> Tuple[Path, ...]:
     return filenames
 
 
-def _check_volumes_from_images(images: Tuple[Path, ...]) -> Tuple[np.ndarray, ...]:
-    """Loads the images and check the dimensions."""
-    images = tuple(nib.load(i) for i in images)
-    volumes = tuple(i.get_fdata() for i in images)
-    four_dimensional_volumes = []
-    for volume in volumes:
-        if volume.ndim == 3:
-            four_dimensional_volumes.append(volume[..., np.newaxis])
-        elif volume.ndim == 4:
-            four_dimensional_volumes.append(volume)
-        else:
+def _merge_volumes_from_images(images: Tuple[Nifti1Image, ...]) -> np.ndarray:
+    """Checks the dimensions of the images and concatenates their volumes.
+
+    The dimensions are checked from the headers before reading any data,
+    and the volumes are written directly into the pre-allocated merged array.
+    """
+    from clinica.utils.filemanip import map_in_threads
+
+    for image in images:
+        if len(image.shape) not in (3, 4):
             raise ValueError(
-                f"Only 3D or 4D images can be concatenated. A {volume.ndim}D image was found."
+                f"Only 3D or 4D images can be concatenated. A {len(image.shape)}D image was found."
             )
+        if image.shape[:3] != images[0].shape[:3]:
+            raise ValueError(
+                "Only images with the same spatial shape can be concatenated. "
+                f"Found images of shapes {images[0].shape[:3]} and {image.shape[:3]}."
+            )
+    n_volumes = [image.shape[3] if len(image.shape) == 4 else 1 for image in images]
+    # The merged image is saved as float32, read the data with this type directly
+    # rather than through get_fdata which upcasts to float64 and caches the array
+    merged_volume = np.empty(images[0].shape[:3] + (sum(n_volumes),), np.float32)
+    starts = np.cumsum([0] + n_volumes[:-1])
+
+    def _fill_volumes(image: Nifti1Image, start: int, n: int) -> None:
+        merged_volume[..., start : start + n] = np.asarray(
+            image.dataobj, dtype=np.float32
+        ).reshape(image.shape[:3] + (n,))
+
+    # Each image is written to its own slab of the merged array. Each thread
+    # also holds the float32 copy of a whole image until it is written, hence
+    # the lower number of threads than for reading headers or small files
+    map_in_threads(_fill_volumes, images, starts, n_volumes, max_workers=8)
 
-    return tuple(four_dimensional_volumes)
+    return merged_volume
 
 
 def remove_dummy_dimension_from_image(image: str, output: str) -> str:
@@ -169,11 +192,15 @@ def remove_dummy_dimension_from_image(image: str, output: str) -> str:
     str :
         The path to the output image.
     """
-    import nibabel as nib
-    from nilearn.image import new_img_like
-
-    img = new_img_like(image, nib.load(image).get_fdata().squeeze())
-    nib.save(img, output)
+    img = nib.load(image)
+    # Keep the data type of the input image rather than upcasting to float64,
+    # unless its scaling factors turn the values into floats
+    data = np.asanyarray(img.dataobj).squeeze()
+    if data.dtype != img.get_data_dtype():
+        data = data.astype(np.float32)
+    header = img.header.copy()
+    header.set_data_dtype(data.dtype)
+    nib.save(nib.Nifti1Image(data, img.affine, header), output)
 
     return output
 
@@ -222,13 +249,18 @@ class Bbox3D:
             Slice(start_z, end_z),
         )
 
-    def get_slices(self) -> Tuple[slice, slice, slice]:
+    @cached_property
+    def slices(self) -> Tuple[slice, slice, slice]:
+        """The slices of the bounding box, only built once."""
         return (
             self.x_slice.get_slice(),
             self.y_slice.get_slice(),
             self.z_slice.get_slice(),
         )
 
+    def get_slices(self) -> Tuple[slice, slice, slice]:
+        return self.slices
+
     def __repr__(self):
         return f"( {self.x_slice}, {self.y_slice}, {self.z_slice} )"
 
@@ -238,9 +270,7 @@ MNI_CROP_BBOX = Bbox3D.from_coordinates(12, 181, 13, 221, 0, 179)
 
 
 def _crop_array(array: np.ndarray, bbox: Bbox3D) -> np.ndarray:
-    # TODO: When Python 3.10 is dropped, replace with 'return array[*bbox.get_slices()]'
-    x, y, z = bbox.get_slices()
-    return array[x, y, z]
+    return array[bbox.slices]
 
 
 def _get_file_locally_or_download(
@@ -277,6 +307,12 @@ def get_mni_cropped_template() -> Path:
     )
 
 
+@lru_cache(maxsize=1)
+def _load_mni_cropped_template() -> Nifti1Image:
+    """Load the cropped MNI template once, its header and affine are shared by all crops."""
+    return nib.load(get_mni_cropped_template())
+
+
 def get_mni_template(modality: str) -> Path:
     """Get the path to the MNI template for the given modality.
 
@@ -351,10 +387,9 @@ def crop_nifti(input_image: Path, output_dir: Optional[Path] = None) -> Path:
     Raises
     ------
     ValueError:
-        If the input image is not 3D.
+        If the input image is not 3D, or if it is smaller than
+        the bounding box used for cropping.
     """
-    from nilearn.image import new_img_like
-
     from clinica.utils.filemanip import get_filename_no_ext
 
     filename_no_ext = get_filename_no_ext(input_image)
@@ -364,10 +399,17 @@ def crop_nifti(input_image: Path, output_dir: Optional[Path] = None) -> Path:
             "The function crop_nifti is implemented for anatomical 3D images. "
             f"You provided an image of shape {input_image.shape}."
         )
+    if any(s.stop > size for s, size in zip(MNI_CROP_BBOX.slices, input_image.shape)):
+        raise ValueError(
+            f"The image of shape {input_image.shape} does not contain the bounding box "
+            f"{MNI_CROP_BBOX} used to crop images in MNI space."
+        )
     output_dir = output_dir or Path.cwd()
-    crop_img = new_img_like(
-        nib.load(get_mni_cropped_template()),
-        _crop_array(input_image.get_fdata(), MNI_CROP_BBOX),
+    # Slice the data proxy such that only the cropped region is scaled and
+    # converted to float64, rather than the whole volume with get_fdata
+    crop_img = nib.Nifti1Image(
+        np.asarray(_crop_array(input_image.dataobj, MNI_CROP_BBOX), dtype=np.float64),
+        _load_mni_cropped_template().affine,
     )
     output_img = output_dir / f"{filename_no_ext}_cropped.nii.gz"
     crop_img.to_filename(output_img)
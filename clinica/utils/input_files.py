@@ -4,11 +4,13 @@ These dictionaries describe files to grab.
 """
 
 import functools
-from collections.abc import Iterable
+import itertools
+from pathlib import Path
 from typing import Optional, Union
 
 from clinica.pipelines.dwi.dti.utils import DTIBasedMeasure
 from clinica.utils.pet import ReconstructionMethod, SUVRReferenceRegion, Tracer
+from clinica.utils.spm import INDEX_TISSUE_MAP
 
 # BIDS
 
@@ -179,31 +181,44 @@ T1W_EXTENSIVE = {
     "needed_pipeline": "t1-extensive",
 }
 
+# The linear pipelines write their transformation to MNI with the same name
+_AFFINE_TO_MNI_PATTERN = "*space-MNI152NLin2009cSym_res-1x1x1_affine.mat"
+
 T1W_TO_MNI_TRANSFORM = {
-    "pattern": "*space-MNI152NLin2009cSym_res-1x1x1_affine.mat",
+    "pattern": _AFFINE_TO_MNI_PATTERN,
     "description": "Transformation matrix from T1W image to MNI space using t1-linear pipeline",
     "needed_pipeline": "t1-linear",
 }
 
 T2W_TO_MNI_TRANSFROM = {
-    "pattern": "*space-MNI152NLin2009cSym_res-1x1x1_affine.mat",
+    "pattern": _AFFINE_TO_MNI_PATTERN,
     "description": "Transformation matrix from T2W image to MNI space using t2-linear pipeline",
     "needed_pipeline": "t2-linear",
 }
 
 FLAIR_T2W_TO_MNI_TRANSFROM = {
-    "pattern": "*space-MNI152NLin2009cSym_res-1x1x1_affine.mat",
+    "pattern": _AFFINE_TO_MNI_PATTERN,
     "description": "Transformation matrix from T2W image to MNI space using t2-linear pipeline",
     "needed_pipeline": "flair-linear",
 }
 
+# Directories of the CAPS queries, built once rather than on every call
+_T1_SPM_SEGMENTATION_DIR = Path("t1") / "spm" / "segmentation"
+_T1_SPM_DARTEL_DIR = Path("t1") / "spm" / "dartel"
+_PET_PREPROCESSING_DIR = Path("pet") / "preprocessing"
+
+
+def _is_sequence(arg) -> bool:
+    # Concrete types are much faster to check than the Iterable ABC
+    return isinstance(arg, (list, tuple))
+
 
 def aggregator(func):
-    """If the decorated function receives iterable arguments,
+    """If the decorated function receives list or tuple arguments,
     this decorator will call the decorated function for each
-    value in the iterable and aggregate the results in a list.
-    This works only if the iterables provided have the same length.
-    Arguments lefts as non-iterable will be repeated.
+    value in the sequence and aggregate the results in a list.
+    This works only if the sequences provided have the same length.
+    Arguments lefts as non-sequence will be repeated.
 
     Examples
     --------
@@ -236,7 +251,7 @@ def aggregator(func):
         }
     ]
 
-    Although this is fine, you might not know in a pipeline what was provided (scalar or iterable).
+    Although this is fine, you might not know in a pipeline what was provided (scalar or sequence).
     With the `aggregator` decorator, you can pass both:
 
     >>> t1_volume_native_tpm((1, 2))
@@ -292,64 +307,44 @@ def aggregator(func):
 
     @functools.wraps(func)
     def wrapper_aggregator(*args, **kwargs):
-        # Get the lengths of iterable args and kwargs
-        arg_sizes = [
-            len(arg)
-            for arg in args
-            if (isinstance(arg, Iterable) and not isinstance(arg, str))
+        # Get the length of list or tuple args and kwargs in a single pass
+        # and raise as soon as two of them have different lengths
+        arg_size = None
+        for arg in itertools.chain(args, kwargs.values()):
+            if _is_sequence(arg):
+                size = len(arg)
+                if arg_size is None:
+                    arg_size = size
+                elif size != arg_size:
+                    raise ValueError(f"Arguments must have the same length.")
+
+        # No sequence case, just call the function
+        if arg_size is None:
+            return func(*args, **kwargs)
+
+        # Iterate over sequences and repeat other values
+        args_iterators = [
+            iter(arg) if _is_sequence(arg) else itertools.repeat(arg) for arg in args
         ]
-        arg_sizes += [
-            len(arg)
+        kwargs_iterators = {
+            k: iter(arg) if _is_sequence(arg) else itertools.repeat(arg)
             for k, arg in kwargs.items()
-            if (isinstance(arg, Iterable) and not isinstance(arg, str))
+        }
+        return [
+            func(
+                *[next(it) for it in args_iterators],
+                **{k: next(it) for k, it in kwargs_iterators.items()},
+            )
+            for _ in range(arg_size)
         ]
 
-        # If iterable args/kwargs have different lengths, raise
-        if len(set(arg_sizes)) > 1:
-            raise ValueError(f"Arguments must have the same length.")
-
-        # No iterable case, just call the function
-        if len(arg_sizes) == 0:
-            return func(*args, **kwargs)
-
-        # Handle args first by repeating non-iterable values
-        arg_size = arg_sizes[0]
-        new_args = []
-        for arg in args:
-            if not (isinstance(arg, Iterable) and not isinstance(arg, str)):
-                new_args.append((arg,) * arg_size)
-            else:
-                new_args.append(arg)
-
-        # Same thing for kwargs
-        new_kwargs = [{} for _ in range(arg_size)]
-        for k, arg in kwargs.items():
-            for i in range(len(new_kwargs)):
-                if not (isinstance(arg, Iterable) and not isinstance(arg, str)):
-                    new_kwargs[i][k] = arg
-                else:
-                    new_kwargs[i][k] = arg[i]
-
-        # Properly encapsulate in a for loop
-        if len(new_args) == 0:
-            return [func(**x) for x in new_kwargs]
-        elif len(new_kwargs) == 0:
-            return [func(*x) for x in zip(*new_args)]
-        return [func(*x, **y) for x, y in zip(zip(*new_args), new_kwargs)]
-
     return wrapper_aggregator
 
 
 @aggregator
 def t1_volume_native_tpm(tissue_number):
-    from pathlib import Path
-
-    from .spm import INDEX_TISSUE_MAP
-
     return {
-        "pattern": Path("t1")
-        / "spm"
-        / "segmentation"
+        "pattern": _T1_SPM_SEGMENTATION_DIR
         / "native_space"
         / f"*_*_T1w_segm-{INDEX_TISSUE_MAP[tissue_number]}_probability.nii*",
         "description": f"Tissue probability map {INDEX_TISSUE_MAP[tissue_number]} in native space",
@@ -359,14 +354,8 @@ def t1_volume_native_tpm(tissue_number):
 
 @aggregator
 def t1_volume_dartel_input_tissue(tissue_number):
-    from pathlib import Path
-
-    from .spm import INDEX_TISSUE_MAP
-
     return {
-        "pattern": Path("t1")
-        / "spm"
-        / "segmentation"
+        "pattern": _T1_SPM_SEGMENTATION_DIR
         / "dartel_input"
         / f"*_*_T1w_segm-{INDEX_TISSUE_MAP[tissue_number]}_dartelinput.nii*",
         "description": f"Dartel input for tissue probability map {INDEX_TISSUE_MAP[tissue_number]} from T1w MRI",
@@ -376,17 +365,11 @@ def t1_volume_dartel_input_tissue(tissue_number):
 
 @aggregator
 def t1_volume_native_tpm_in_mni(tissue_number, modulation):
-    from pathlib import Path
-
-    from .spm import INDEX_TISSUE_MAP
-
     pattern_modulation = "on" if modulation else "off"
     description_modulation = "with" if modulation else "without"
 
     return {
-        "pattern": Path("t1")
-        / "spm"
-        / "segmentation"
+        "pattern": _T1_SPM_SEGMENTATION_DIR
         / "normalized_space"
         / f"*_*_T1w_segm-{INDEX_TISSUE_MAP[tissue_number]}_space-Ixi549Space_modulated-{pattern_modulation}_probability.nii*",
         "description": (
@@ -420,19 +403,13 @@ def t1_volume_template_tpm_in_mni(group_label, tissue_number, modulation, fwhm=N
     dict :
         Information dict to be passed to clinica_file_reader.
     """
-    from pathlib import Path
-
-    from .spm import INDEX_TISSUE_MAP
-
     pattern_modulation = "on" if modulation else "off"
     description_modulation = "with" if modulation else "without"
     fwhm_key_value = f"_fwhm-{fwhm}mm" if fwhm else ""
     fwhm_description = f"with {fwhm}mm smoothing" if fwhm else "with no smoothing"
 
     return {
-        "pattern": Path("t1")
-        / "spm"
-        / "dartel"
+        "pattern": _T1_SPM_DARTEL_DIR
         / f"group-{group_label}"
         / f"*_T1w_segm-{INDEX_TISSUE_MAP[tissue_number]}_space-Ixi549Space_modulated-{pattern_modulation}{fwhm_key_value}_probability.nii*",
         "description": (
@@ -444,12 +421,8 @@ def t1_volume_template_tpm_in_mni(group_label, tissue_number, modulation, fwhm=N
 
 
 def t1_volume_deformation_to_template(group_label):
-    from pathlib import Path
-
     information = {
-        "pattern": Path("t1")
-        / "spm"
-        / "dartel"
+        "pattern": _T1_SPM_DARTEL_DIR
         / f"group-{group_label}"
         / f"sub-*_ses-*_T1w_target-{group_label}_transformation-forward_deformation.nii*",
         "description": f"Deformation from native space to group template {group_label} space.",
@@ -460,8 +433,6 @@ def t1_volume_deformation_to_template(group_label):
 
 @aggregator
 def t1_volume_i_th_iteration_group_template(group_label, i):
-    from pathlib import Path
-
     information = {
         "pattern": Path(f"group-{group_label}")
         / "t1"
@@ -473,8 +444,6 @@ def t1_volume_i_th_iteration_group_template(group_label, i):
 
 
 def t1_volume_final_group_template(group_label):
-    from pathlib import Path
-
     information = {
         "pattern": Path(f"group-{group_label}")
         / "t1"
@@ -601,8 +570,6 @@ def bids_pet_nii(
     dict :
         The query dictionary to get PET scans.
     """
-    from pathlib import Path
-
     description = f"PET data"
     trc = ""
     if tracer is not None:
@@ -632,8 +599,6 @@ def pet_volume_normalized_suvr_pet(
     use_pvc_data: bool,
     fwhm: int = 0,
 ) -> dict:
-    from pathlib import Path
-
     acq_label = Tracer(acq_label)
     region = SUVRReferenceRegion(suvr_reference_region)
 
@@ -661,8 +626,7 @@ def pet_volume_normalized_suvr_pet(
     suvr_key_value = f"_suvr-{region.value}"
 
     information = {
-        "pattern": Path("pet")
-        / "preprocessing"
+        "pattern": _PET_PREPROCESSING_DIR
         / f"group-{group_label}"
         / f"*_trc-{acq_label.value}_pet_space-Ixi549Space{pvc_key_value}{suvr_key_value}{mask_key_value}{fwhm_key_value}_pet.nii*",
         "description": (
@@ -679,8 +643,6 @@ def pet_linear_nii(
     suvr_reference_region: Union[str, SUVRReferenceRegion],
     uncropped_image: bool,
 ) -> dict:
-    from pathlib import Path
-
     acq_label = Tracer(acq_label)
     region = SUVRReferenceRegion(suvr_reference_region)
 
@@ -2,7 +2,9 @@
 
 See CAPS specifications for details about long ID.
 """
+import tempfile
 from os import PathLike
+from pathlib import Path
 from typing import List, Optional, Tuple, Union
 
 
@@ -35,31 +37,20 @@ def get_unique_subjects(
     >>> get_unique_subjects(['sub-CLNC01', 'sub-CLNC01', 'sub-CLNC02'], ['ses-M000', 'ses-M018', 'ses-M000'])
     (['sub-CLNC01', 'sub-CLNC02'], [['ses-M000', 'ses-M018'], ['ses-M000']])
     """
-    import numpy as np
-
     if len(subjects) != len(sessions):
         raise ValueError(
             "The number of subjects should match the number of sessions.\n"
             f"You provided the following subjects: {subjects}.\n"
             f"And the following sessions: {sessions}."
         )
-    subjects = np.array(subjects)
-    sessions = np.array(sessions)
-
-    # The second returned element indicates for each participant_id the
-    # element they correspond to in the 'unique' list. We will use this
-    # to link each session_id in the repeated list of session_id to
-    # their corresponding unique participant_id
-
-    unique_subjects, inverse_positions = np.unique(subjects, return_inverse=True)
-    sessions_per_subject = [
-        sessions[inverse_positions == subject_index].tolist()
-        for subject_index in range(len(unique_subjects))
-    ]
-    if len(unique_subjects) != len(sessions_per_subject):
-        raise ValueError("Problem while getting unique subjects and sessions lists.")
+    sessions_per_subject = {}
+    for subject, session in zip(subjects, sessions):
+        sessions_per_subject.setdefault(subject, []).append(session)
+    unique_subjects = sorted(sessions_per_subject)
 
-    return unique_subjects.tolist(), sessions_per_subject
+    return unique_subjects, [
+        sessions_per_subject[subject] for subject in unique_subjects
+    ]
 
 
 def unique_subjects_sessions_to_subjects_sessions(
@@ -217,21 +208,23 @@ def get_subject_session_list(
     However, if your pipeline needs both T1w and DWI files, you will need to check
     with e.g. clinica_file_reader_function.
     """
-    import tempfile
-    from pathlib import Path
-    from time import localtime, strftime, time
-
     from clinica.iotools.utils.data_handling import create_subs_sess_list
 
     if not subject_session_file:
         output_dir = Path(tsv_dir) if tsv_dir else Path(tempfile.mkdtemp())
-        timestamp = strftime("%Y%m%d_%H%M%S", localtime(time()))
-        tsv_file = f"subjects_sessions_list_{timestamp}.tsv"
-        subject_session_file = output_dir / tsv_file
+        output_dir.mkdir(parents=True, exist_ok=True)
+        # Reserve a unique file name, such that concurrent calls never share it
+        with tempfile.NamedTemporaryFile(
+            prefix="subjects_sessions_list_",
+            suffix=".tsv",
+            dir=output_dir,
+            delete=False,
+        ) as tsv_file:
+            subject_session_file = Path(tsv_file.name)
         create_subs_sess_list(
             input_dir=input_dir,
             output_dir=output_dir,
-            file_name=tsv_file,
+            file_name=subject_session_file.name,
             is_bids_dir=is_bids_dir,
             use_session_tsv=use_session_tsv,
         )
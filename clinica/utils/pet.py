@@ -2,10 +2,13 @@
 import os
 import typing as ty
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 
 import pandas as pd
 
+_MASKS_DIR = Path(os.path.realpath(__file__)).parent.parent / "resources" / "masks"
+
 
 class Tracer(str, Enum):
     """BIDS label for PET tracers.
@@ -68,7 +71,7 @@ def read_psf_information(
     pvc_psf_tsv : PathLike
         Path to the TSV file containing the following columns:
         'participant_id', 'session_id', 'acq_label', 'psf_x',
-        'psf_y', and 'psf_z'
+        'psf_y', and 'psf_z'. Other columns are ignored.
 
     subject_ids : List[str]
         List of participant IDs.
@@ -112,38 +115,57 @@ def read_psf_information(
         "psf_y",
         "psf_z",
     }
-    pet_tracer = Tracer(pet_tracer)
-    psf_df = pd.read_csv(pvc_psf_tsv, sep="\t")
-    diff = valid_columns.symmetric_difference(set(psf_df.columns))
-    if len(diff) > 0:
+    tracer = Tracer(pet_tracer).value
+    # Identifiers are compared as strings, no need to infer their type.
+    # Other columns are not needed and are skipped while parsing.
+    psf_df = pd.read_csv(
+        pvc_psf_tsv,
+        sep="\t",
+        usecols=lambda column: column in valid_columns,
+        dtype={"participant_id": str, "session_id": str, "acq_label": str},
+    )
+    missing_columns = valid_columns.difference(psf_df.columns)
+    if missing_columns:
         raise IOError(
             f"The file {pvc_psf_tsv} must contain the following columns (separated by tabulations):\n"
             f"participant_id, session_id, acq_label, psf_x, psf_y, psf_z\n"
-            f"{str(list(psf_df.columns))}\n"
+            f"Missing columns: {sorted(missing_columns)}\n"
             f"Pay attention to the spaces (there should be none)."
         )
+    # Only keep the rows of the tracer and the columns used for the lookup
+    psf_df = psf_df.loc[
+        psf_df["acq_label"].values == tracer,
+        ["participant_id", "session_id", "psf_x", "psf_y", "psf_z"],
+    ]
+    # Index the PSF of the tracer by image once instead of querying the whole
+    # DataFrame for each of them
+    psf_per_image = {}
+    for image, image_psf in zip(
+        zip(psf_df["participant_id"], psf_df["session_id"]),
+        psf_df[["psf_x", "psf_y", "psf_z"]].values.tolist(),
+    ):
+        psf_per_image.setdefault(image, []).append(image_psf)
     psf = []
     for sub, ses in zip(subject_ids, session_ids):
-        result = psf_df.query(
-            f"participant_id == '{sub}' and session_id == '{ses}' and acq_label == '{pet_tracer.value}'"
-        )
+        result = psf_per_image.get((sub, ses), [])
         if len(result) == 0:
             raise RuntimeError(
-                f"Subject {sub} with session {ses} and tracer {pet_tracer.value} "
+                f"Subject {sub} with session {ses} and tracer {tracer} "
                 f"that you want to proceed was not found in the TSV file containing "
                 f"PSF specifications ({pvc_psf_tsv})."
             )
         if len(result) > 1:
             raise RuntimeError(
-                f"Subject {sub} with session {ses} and tracer {pet_tracer.value} "
+                f"Subject {sub} with session {ses} and tracer {tracer} "
                 f"that you want to proceed was found multiple times "
                 f"in the TSV file containing PSF specifications ({pvc_psf_tsv})."
             )
-        psf.append(result[["psf_x", "psf_y", "psf_z"]].values.tolist()[0])
+        psf.append(result[0])
 
     return psf
 
 
+@lru_cache(maxsize=None)
 def get_suvr_mask(region: ty.Union[str, SUVRReferenceRegion]) -> Path:
     """Returns the path to the SUVR mask from SUVR reference region label.
 
@@ -158,20 +180,18 @@ def get_suvr_mask(region: ty.Union[str, SUVRReferenceRegion]) -> Path:
     Path :
         The path to the SUVR mask.
     """
-    current_dir = Path(os.path.realpath(__file__))
-    masks_dir = current_dir.parent.parent / "resources" / "masks"
-
-    return masks_dir / _get_suvr_reference_region_labels_filename(
+    return _MASKS_DIR / _get_suvr_reference_region_labels_filename(
         SUVRReferenceRegion(region)
     )
 
 
+_SUVR_REFERENCE_REGION_MASK_FILENAMES = {
+    SUVRReferenceRegion.PONS: "region-pons_eroded-6mm_mask.nii.gz",
+    SUVRReferenceRegion.CEREBELLUM_PONS: "region-cerebellumPons_eroded-6mm_mask.nii.gz",
+    SUVRReferenceRegion.PONS2: "region-pons_remove-extrabrain_eroded-2it_mask.nii.gz",
+    SUVRReferenceRegion.CEREBELLUM_PONS2: "region-cerebellumPons_remove-extrabrain_eroded-3it_mask.nii.gz",
+}
+
+
 def _get_suvr_reference_region_labels_filename(region: SUVRReferenceRegion) -> str:
-    if region == SUVRReferenceRegion.PONS:
-        return "region-pons_eroded-6mm_mask.nii.gz"
-    if region == SUVRReferenceRegion.CEREBELLUM_PONS:
-        return "region-cerebellumPons_eroded-6mm_mask.nii.gz"
-    if region == SUVRReferenceRegion.PONS2:
-        return "region-pons_remove-extrabrain_eroded-2it_mask.nii.gz"
-    if region == SUVRReferenceRegion.CEREBELLUM_PONS2:
-        return "region-cerebellumPons_remove-extrabrain_eroded-3it_mask.nii.gz"
+    return _SUVR_REFERENCE_REGION_MASK_FILENAMES[region]
@@ -1,5 +1,6 @@
 """This module contains SPM utilities."""
 import warnings
+from functools import lru_cache
 from os import PathLike
 from pathlib import Path
 
@@ -26,11 +27,19 @@ def get_tpm() -> PathLike:
     PathLike :
         TPM.nii path from SPM
     """
-    from glob import glob
-
     from .check_dependency import get_spm_home
 
-    spm_home = get_spm_home()
+    return _find_tpm(get_spm_home())
+
+
+@lru_cache
+def _find_tpm(spm_home: Path) -> str:
+    """Search the SPM home directory for the TPM file.
+
+    The recursive search is only performed once per SPM home directory.
+    """
+    from glob import glob
+
     tpm_file_glob = glob(str(spm_home / "**/TPM.nii"), recursive=True)
     if len(tpm_file_glob) == 0:
         raise RuntimeError(f"No file found for TPM.nii in your $SPM_HOME in {spm_home}")
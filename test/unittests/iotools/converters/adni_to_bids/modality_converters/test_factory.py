@@ -0,0 +1,52 @@
+import pytest
+
+from clinica.iotools.converters.adni_to_bids.adni_utils import (
+    ADNIModality,
+    ADNIModalityConverter,
+)
+
+
+@pytest.mark.parametrize(
+    "modality,expected",
+    [
+        ("T1", ["convert_t1"]),
+        ("PET_AMYLOID", ["convert_pib_pet", "convert_av45_fbb_pet"]),
+        ("PET_TAU", ["convert_tau_pet"]),
+        ("DWI", ["convert_dwi"]),
+        ("FLAIR", ["convert_flair"]),
+        ("fMRI", ["convert_fmri"]),
+        ("FMAP", ["convert_fmap"]),
+    ],
+)
+def test_modality_converter_factory(modality, expected):
+    from clinica.iotools.converters.adni_to_bids.modality_converters import (
+        modality_converter_factory,
+    )
+
+    assert [
+        converter.__name__ for converter in modality_converter_factory(modality)
+    ] == expected
+
+
+def test_modality_converter_factory_fdg():
+    from clinica.iotools.converters.adni_to_bids.modality_converters import (
+        modality_converter_factory,
+    )
+    from clinica.iotools.converters.adni_to_bids.modality_converters._fdg_pet import (
+        convert_fdg_pet,
+        convert_fdg_pet_uniform,
+    )
+
+    assert modality_converter_factory(ADNIModality.PET_FDG) == [
+        convert_fdg_pet,
+        convert_fdg_pet_uniform,
+    ]
+
+
+@pytest.mark.parametrize("converter", ADNIModalityConverter)
+def test_converter_factory_is_cached(converter):
+    from clinica.iotools.converters.adni_to_bids.modality_converters import (
+        converter_factory,
+    )
+
+    assert converter_factory(converter) is converter_factory(converter)
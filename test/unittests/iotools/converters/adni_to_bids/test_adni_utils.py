@@ -291,3 +291,45 @@ def test_load_clinical_csv_value_error(tmp_path):
         "be loaded as a DataFrame. Please check your data.",
     ):
         load_clinical_csv(tmp_path, "adnimerge")
+
+
+def test_correct_diagnosis_sc_adni3(tmp_path):
+    from clinica.iotools.converters.adni_to_bids.adni_utils import (
+        correct_diagnosis_sc_adni3,
+    )
+
+    pd.DataFrame(
+        {
+            "PTID": ["001_S_0001", "001_S_0001", "001_S_0002", "001_S_0003"],
+            "VISCODE2": ["sc", "m12", "sc", "m12"],
+            "DIAGNOSIS": [2, 3, 1, 3],
+        }
+    ).to_csv(tmp_path / "DXSUM_PDXCONV.csv", index=False)
+    participants = pd.DataFrame(
+        {
+            "alternative_id_1": [
+                "001_S_0001",
+                "001_S_0002",
+                "001_S_0003",
+                "001_S_0004",
+            ],
+            "original_study": ["ADNI3", "ADNI2", "ADNI3", "ADNI3"],
+            "diagnosis_sc": ["n/a", "CN", "n/a", "n/a"],
+        }
+    )
+
+    assert_frame_equal(
+        correct_diagnosis_sc_adni3(tmp_path, participants),
+        pd.DataFrame(
+            {
+                "alternative_id_1": [
+                    "001_S_0001",
+                    "001_S_0002",
+                    "001_S_0003",
+                    "001_S_0004",
+                ],
+                "original_study": ["ADNI3", "ADNI2", "ADNI3", "ADNI3"],
+                "diagnosis_sc": ["MCI", "CN", "n/a", "n/a"],
+            }
+        ),
+    )
@@ -1,4 +1,14 @@
+from pathlib import Path
+
+import pandas as pd
 import pytest
+from pandas.testing import assert_frame_equal
+
+
+def _get_specifications_folder() -> Path:
+    from clinica.iotools.converters import aibl_to_bids
+
+    return Path(aibl_to_bids.__file__).parents[1] / "specifications"
 
 
 def test_listdir_nohidden(tmp_path):
@@ -40,3 +50,228 @@ def test_get_first_file_matching_pattern_error(tmp_path, pattern, msg):
 
     with pytest.raises(ValueError, match=msg):
         _get_first_file_matching_pattern(tmp_path, pattern)
+
+
+@pytest.fixture
+def clinical_data_path(tmp_path) -> Path:
+    clinical_data_path = tmp_path / "clinical_data"
+    clinical_data_path.mkdir()
+    pd.DataFrame(
+        {
+            "RID": [1, 2, 3],
+            "SITEID": [10, 20, 20],
+            "VISCODE": ["bl", "bl", "bl"],
+            "PTGENDER": [1, 2, -4],
+            "PTDOB": ["/1950", "/1960", "/1970"],
+        }
+    ).to_csv(clinical_data_path / "aibl_ptdemog_01-Jun-2018.csv", index=False)
+    pd.DataFrame(
+        {
+            "RID": [1, 2, 3],
+            "VISCODE": ["bl", "bl", "bl"],
+            "APGEN1": [3, 4, -4],
+            "APGEN2": [3, 3, -4],
+        }
+    ).to_csv(clinical_data_path / "aibl_apoeres_01-Jun-2018.csv", index=False)
+    visits = {"RID": [1, 1, 2], "VISCODE": ["bl", "m18", "bl"]}
+    for name, values in (
+        ("neurobat", {"EXAMDATE": ["01/01/2000", "07/01/2001", "06/15/2010"]}),
+        ("cdr", {"CDGLOBAL": [0.0, 0.5, -4]}),
+        ("mmse", {"MMSCORE": [29, 27, -4]}),
+        ("pdxconv", {"DXCURREN": [1, 2, -4]}),
+    ):
+        pd.DataFrame({**visits, **values}).to_csv(
+            clinical_data_path / f"aibl_{name}_01-Jun-2018.csv", index=False
+        )
+    return clinical_data_path
+
+
+def test_create_participants_tsv_file(tmp_path, clinical_data_path):
+    from clinica.iotools.converters.aibl_to_bids.utils.clinical import (
+        create_participants_tsv_file,
+    )
+
+    bids_path = tmp_path / "bids"
+    bids_path.mkdir()
+    create_participants_tsv_file(
+        bids_path, _get_specifications_folder(), clinical_data_path
+    )
+    result = pd.read_csv(
+        bids_path / "participants.tsv", sep="\t", dtype=str, keep_default_na=False
+    )
+
+    assert_frame_equal(
+        result,
+        pd.DataFrame(
+            {
+                "participant_id": ["sub-AIBL1", "sub-AIBL2", "sub-AIBL3"],
+                "alternative_id_1": ["1", "2", "3"],
+                "date_of_birth": ["1950", "1960", "1970"],
+                "sex": ["M", "F", "n/a"],
+                "site": ["10", "20", "20"],
+                "apoe_gen1": ["3", "4", "n/a"],
+                "apoe_gen2": ["3", "3", "n/a"],
+            }
+        ),
+    )
+
+
+def test_compute_ages_at_each_exam():
+    from clinica.iotools.converters.aibl_to_bids.utils.clinical import (
+        _compute_ages_at_each_exam,
+    )
+
+    assert _compute_ages_at_each_exam(
+        "/1950", ["01/01/1950", "07/02/1970", "12/31/2000"]
+    ) == [0.0, 20.5, 51.0]
+    assert _compute_ages_at_each_exam("/1950", []) == []
+
+
+@pytest.mark.parametrize("n_procs", [1, 2])
+def test_create_sessions_tsv_file(tmp_path, clinical_data_path, n_procs):
+    from clinica.iotools.converters.aibl_to_bids.utils.clinical import (
+        create_sessions_tsv_file,
+    )
+
+    bids_path = tmp_path / "bids"
+    for subject in ("sub-AIBL1", "sub-AIBL2"):
+        (bids_path / subject).mkdir(parents=True)
+    create_sessions_tsv_file(
+        bids_path, clinical_data_path, _get_specifications_folder(), n_procs=n_procs
+    )
+    result = pd.read_csv(
+        bids_path / "sub-AIBL1" / "sub-AIBL1_sessions.tsv",
+        sep="\t",
+        dtype=str,
+        keep_default_na=False,
+    )
+
+    assert_frame_equal(
+        result,
+        pd.DataFrame(
+            {
+                "session_id": ["ses-M000", "ses-M018"],
+                "months": ["000", "18"],
+                "age": ["50.0", "51.5"],
+                "MMS": ["29", "27"],
+                "cdr_global": ["0.0", "0.5"],
+                "diagnosis": ["CN", "MCI"],
+                "examination_date": ["01/01/2000", "07/01/2001"],
+            }
+        ),
+    )
+    result = pd.read_csv(
+        bids_path / "sub-AIBL2" / "sub-AIBL2_sessions.tsv",
+        sep="\t",
+        dtype=str,
+        keep_default_na=False,
+    )
+
+    assert result.loc[0, "MMS"] == "n/a"
+    assert result.loc[0, "diagnosis"] == "n/a"
+
+
+def test_clean_exam_dates(tmp_path, clinical_data_path):
+    from clinica.iotools.converters.aibl_to_bids.utils.clinical import (
+        _clean_exam_dates,
+        _load_alternative_exam_dates,
+        create_sessions_tsv_file,
+    )
+
+    alternative_exam_dates = {
+        "mri3meta": {"RID": [1, 2], "VISCODE": ["m18", "m18"]},
+        "mrimeta": {"RID": [1, 1], "VISCODE": ["m18", "m36"]},
+        "cdr": {"RID": [1], "VISCODE": ["m18"]},
+        # The flutemeta file is read with its 36 first columns only
+        "flutemeta": {
+            "RID": [],
+            "VISCODE": [],
+            **{f"column_{i}": [] for i in range(33)},
+        },
+        "mmse": {"RID": [], "VISCODE": []},
+        "pibmeta": {"RID": [], "VISCODE": []},
+    }
+    exam_dates = {
+        "mri3meta": ["-4", "01/01/1990"],
+        "mrimeta": ["08/01/2001", "-4"],
+        "cdr": ["09/01/2001"],
+    }
+    for name, data in alternative_exam_dates.items():
+        pd.DataFrame({**data, "EXAMDATE": exam_dates.get(name, [])}).to_csv(
+            tmp_path / f"aibl_{name}_01-Jun-2018.csv", index=False
+        )
+
+    assert _clean_exam_dates(
+        1, ["01/01/2000", "-4", "-4"], ["bl", "m18", "m36"], tmp_path
+    ) == ["01/01/2000", "08/01/2001", "01/01/2003"]
+
+    # Alternative exam dates are loaded once per clinical data folder
+    for csv_file in tmp_path.glob("*.csv"):
+        csv_file.unlink()
+
+    assert _clean_exam_dates(2, ["-4"], ["m18"], tmp_path) == ["01/01/1990"]
+
+    # The cache does not outlive the conversion that follows
+    assert _load_alternative_exam_dates.cache_info().currsize == 1
+    create_sessions_tsv_file(
+        tmp_path / "bids", clinical_data_path, _get_specifications_folder()
+    )
+    assert _load_alternative_exam_dates.cache_info().currsize == 0
+
+
+def test_create_scans_tsv_file(tmp_path):
+    from clinica.iotools.converters.aibl_to_bids.utils.clinical import (
+        create_scans_tsv_file,
+    )
+
+    clinical_data_path = tmp_path / "clinical_data"
+    clinical_data_path.mkdir()
+    metadata = {
+        "mrimeta": {"RID": [], "VISCODE": [], "EXAMDATE": []},
+        "mri3meta": {
+            "RID": [1, 1, 2],
+            "VISCODE": ["bl", "m18", "bl"],
+            "EXAMDATE": ["01/01/2000", "07/01/2001", "-4"],
+        },
+        "av45meta": {"RID": [1], "VISCODE": ["m18"], "EXAMDATE": ["07/02/2001"]},
+        "pibmeta": {"RID": [], "VISCODE": [], "EXAMDATE": []},
+        "flutemeta": {"RID": [], "VISCODE": [], "EXAMDATE": []},
+    }
+    for name, data in metadata.items():
+        pd.DataFrame(data).to_csv(
+            clinical_data_path / f"aibl_{name}_01-Jun-2018.csv", index=False
+        )
+    bids_path = tmp_path / "bids"
+    for subject, session, filename in (
+        ("sub-AIBL1", "ses-M000", "anat/sub-AIBL1_ses-M000_T1w.nii.gz"),
+        ("sub-AIBL1", "ses-M018", "anat/sub-AIBL1_ses-M018_T1w.nii.gz"),
+        ("sub-AIBL1", "ses-M018", "pet/sub-AIBL1_ses-M018_trc-18FAV45_pet.nii.gz"),
+        ("sub-AIBL2", "ses-M000", "anat/sub-AIBL2_ses-M000_T1w.nii.gz"),
+    ):
+        (bids_path / subject / session / filename).parent.mkdir(
+            parents=True, exist_ok=True
+        )
+        (bids_path / subject / session / filename).touch()
+    create_scans_tsv_file(bids_path, clinical_data_path, _get_specifications_folder())
+
+    def read_scans(subject: str, session: str) -> list:
+        return (
+            pd.read_csv(
+                bids_path / subject / session / f"{subject}_{session}_scans.tsv",
+                sep="\t",
+                keep_default_na=False,
+            )
+            .sort_values("filename")
+            .values.tolist()
+        )
+
+    assert read_scans("sub-AIBL1", "ses-M000") == [
+        ["anat/sub-AIBL1_ses-M000_T1w.nii.gz", "2000-01-01T00:00:00"]
+    ]
+    assert read_scans("sub-AIBL1", "ses-M018") == [
+        ["anat/sub-AIBL1_ses-M018_T1w.nii.gz", "2001-07-01T00:00:00"],
+        ["pet/sub-AIBL1_ses-M018_trc-18FAV45_pet.nii.gz", "2001-07-02T00:00:00"],
+    ]
+    assert read_scans("sub-AIBL2", "ses-M000") == [
+        ["anat/sub-AIBL2_ses-M000_T1w.nii.gz", "n/a"]
+    ]
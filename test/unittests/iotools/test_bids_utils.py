@@ -400,3 +400,32 @@ def get_expected_readme_content(study_name: StudyName) -> str:
         website="https://www.clinica.run",
         study=study_name.value,
     )
+
+
+def test_write_scans_tsv(tmp_path):
+    from clinica.iotools.bids_utils import write_scans_tsv
+
+    session_path = tmp_path / "sub-01" / "ses-M000"
+    for folder, filename in (
+        ("anat", "sub-01_ses-M000_T1w.nii.gz"),
+        ("pet", "sub-01_ses-M000_trc-18FAV45_pet.nii.gz"),
+    ):
+        (session_path / folder).mkdir(parents=True)
+        (session_path / folder / filename).touch()
+    scans = pd.DataFrame(
+        [
+            ("sub-01", "ses-M000", "T1/DWI/fMRI/FMAP", "acq_time", "n/a"),
+            ("sub-01", "ses-M000", "T1/DWI/fMRI/FMAP", "acq_time", "2000-01-01"),
+            ("sub-01", "ses-M000", "18FAV45", "acq_time", None),
+        ],
+        columns=["bids_id", "session_id", "modality", "field", "value"],
+    )
+    write_scans_tsv(tmp_path, ["sub-01"], scans)
+    scans = pd.read_csv(
+        session_path / "sub-01_ses-M000_scans.tsv", sep="\t", keep_default_na=False
+    )
+
+    assert scans.sort_values("filename").values.tolist() == [
+        ["anat/sub-01_ses-M000_T1w.nii.gz", "2000-01-01"],
+        ["pet/sub-01_ses-M000_trc-18FAV45_pet.nii.gz", "n/a"],
+    ]
@@ -50,3 +50,35 @@ def test_validate_output_tsv_path_error(tmp_path):
         match="Output path extension must be tsv.",
     ):
         _validate_output_tsv_path(tmp_path / "bar.txt")
+
+
+def test_check_volume_location_in_world_coordinate_system(tmp_path, capsys):
+    import nibabel as nib
+    import numpy as np
+
+    from clinica.iotools.utils.data_handling import (
+        check_volume_location_in_world_coordinate_system,
+    )
+
+    centered_affine = np.eye(4)
+    centered_affine[:3, 3] = -2
+    shifted_affine = np.eye(4)
+    shifted_affine[:3, 3] = 100
+    for filename, affine in (
+        ("centered.nii.gz", centered_affine),
+        ("shifted.nii.gz", shifted_affine),
+    ):
+        nib.Nifti1Image(np.zeros((4, 4, 4)), affine).to_filename(tmp_path / filename)
+
+    assert check_volume_location_in_world_coordinate_system(
+        [str(tmp_path / "centered.nii.gz")], tmp_path, skip_question=True
+    )
+    assert not check_volume_location_in_world_coordinate_system(
+        [str(tmp_path / "centered.nii.gz"), str(tmp_path / "shifted.nii.gz")],
+        tmp_path,
+        skip_question=True,
+    )
+    output = capsys.readouterr().out
+    assert "It appears that 1 files have a center way out" in output
+    assert "shifted.nii.gz" in output
+    assert "centered.nii.gz" not in output
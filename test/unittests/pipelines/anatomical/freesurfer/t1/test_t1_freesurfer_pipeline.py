@@ -0,0 +1,89 @@
+import pytest
+
+
+def test_get_processed_images(tmp_path):
+    from clinica.pipelines.anatomical.freesurfer.t1.pipeline import T1FreeSurfer
+
+    for subject, session in (
+        ("sub-01", "ses-M000"),
+        ("sub-01", "ses-M012"),
+        ("sub-03", "ses-M000"),
+    ):
+        mri_folder = (
+            tmp_path
+            / "subjects"
+            / subject
+            / session
+            / "t1"
+            / "freesurfer_cross_sectional"
+            / f"{subject}_{session}"
+            / "mri"
+        )
+        mri_folder.mkdir(parents=True)
+        (mri_folder / "aparc.a2009s+aseg.mgz").touch()
+
+    assert T1FreeSurfer.get_processed_images(
+        tmp_path,
+        ["sub-01", "sub-02", "sub-03", "sub-01"],
+        ["ses-M012", "ses-M000", "ses-M000", "ses-M000"],
+    ) == ["sub-01_ses-M012", "sub-03_ses-M000", "sub-01_ses-M000"]
+
+
+def test_get_processed_images_no_caps(tmp_path):
+    from clinica.pipelines.anatomical.freesurfer.t1.pipeline import T1FreeSurfer
+
+    assert (
+        T1FreeSurfer.get_processed_images(tmp_path / "caps", ["sub-01"], ["ses-M000"])
+        == []
+    )
+
+
+def test_get_processed_images_case_insensitive(tmp_path):
+    from clinica.pipelines.anatomical.freesurfer.t1.pipeline import T1FreeSurfer
+
+    mri_folder = (
+        tmp_path
+        / "subjects"
+        / "sub-01"
+        / "ses-M000"
+        / "T1"
+        / "freesurfer_cross_sectional"
+        / "sub-01_ses-M000"
+        / "mri"
+    )
+    mri_folder.mkdir(parents=True)
+    (mri_folder / "aparc.a2009s+aseg.mgz").touch()
+
+    assert T1FreeSurfer.get_processed_images(tmp_path, ["sub-01"], ["ses-M000"]) == [
+        "sub-01_ses-M000"
+    ]
+
+
+def test_get_processed_images_multiple_matches(tmp_path):
+    from clinica.pipelines.anatomical.freesurfer.t1.pipeline import T1FreeSurfer
+
+    for folder in ("sub-01_ses-M000", "sub-01_ses-M000.bak"):
+        mri_folder = (
+            tmp_path
+            / "subjects"
+            / "sub-01"
+            / "ses-M000"
+            / "t1"
+            / "freesurfer_cross_sectional"
+            / folder
+            / "mri"
+        )
+        mri_folder.mkdir(parents=True)
+        (mri_folder / "aparc.a2009s+aseg.mgz").touch()
+
+    assert T1FreeSurfer.get_processed_images(tmp_path, ["sub-01"], ["ses-M000"]) == []
+
+
+def test_get_processed_images_bids_folder_error(tmp_path):
+    from clinica.pipelines.anatomical.freesurfer.t1.pipeline import T1FreeSurfer
+    from clinica.utils.exceptions import ClinicaCAPSError
+
+    (tmp_path / "sub-01").mkdir()
+
+    with pytest.raises(ClinicaCAPSError):
+        T1FreeSurfer.get_processed_images(tmp_path, ["sub-01"], ["ses-M000"])
@@ -41,3 +41,106 @@ def test_read_and_check_tsv_file():
     df = read_and_check_tsv_file(Path(CURRENT_DIR) / "data/subjects.tsv")
     assert len(df) == 7
     assert set(df.columns) == {"group", "age", "sex"}
+
+
+@pytest.mark.parametrize("absolute_template", [True, False])
+def test_build_thickness_array(tmp_path, absolute_template):
+    import nibabel as nib
+    import numpy as np
+
+    from clinica.pipelines.statistics_surface.surfstat._utils import (
+        T1_FREESURFER_TEMPLATE_PATH_FROM_CAPS_ROOT,
+        build_thickness_array,
+        get_t1_freesurfer_custom_file_template,
+    )
+
+    surface_file = get_t1_freesurfer_custom_file_template(tmp_path)
+    df = pd.DataFrame(
+        {"age": [70, 75]},
+        index=pd.MultiIndex.from_tuples(
+            [("sub-01", "ses-M000"), ("sub-02", "ses-M000")],
+            names=["participant_id", "session_id"],
+        ),
+    )
+    expected = []
+    for row, (subject, session) in enumerate(df.index):
+        values = []
+        for hemi, n_vertices in (("lh", 3), ("rh", 2)):
+            data = np.arange(n_vertices, dtype=np.float32).reshape(-1, 1, 1) + row
+            path = Path(
+                surface_file
+                % {"subject": subject, "session": session, "fwhm": 20, "hemi": hemi}
+            )
+            path.parent.mkdir(parents=True, exist_ok=True)
+            nib.MGHImage(data, np.eye(4)).to_filename(path)
+            values.extend(data.ravel())
+        expected.append(values)
+
+    thickness = build_thickness_array(
+        tmp_path,
+        surface_file
+        if absolute_template
+        else T1_FREESURFER_TEMPLATE_PATH_FROM_CAPS_ROOT.lstrip("/"),
+        df,
+        20,
+    )
+
+    assert thickness.dtype == np.float32
+    assert np.array_equal(thickness, np.array(expected))
+
+
+def test_get_average_surface(tmp_path):
+    import numpy as np
+    from nibabel.freesurfer import write_geometry
+
+    from clinica.pipelines.statistics_surface.surfstat._utils import (
+        get_average_surface,
+    )
+
+    coordinates = np.arange(12, dtype=float).reshape(4, 3)
+    faces = np.array([[0, 1, 2], [1, 2, 3]])
+    for hemi in ("lh", "rh"):
+        write_geometry(tmp_path / f"{hemi}.pial", coordinates, faces)
+
+    average_surface, average_mesh = get_average_surface(tmp_path)
+
+    expected_faces = np.vstack([faces, faces + 4])
+    assert np.array_equal(average_mesh.coordinates, np.vstack([coordinates] * 2))
+    assert np.array_equal(average_mesh.faces, expected_faces)
+    assert np.array_equal(average_surface["coord"], average_mesh.coordinates)
+    assert np.array_equal(average_surface["tri"], expected_faces + 1)
+
+
+def test_check_fsaverage_files_error(tmp_path):
+    from clinica.pipelines.statistics_surface.surfstat._utils import (
+        check_fsaverage_files,
+    )
+
+    (tmp_path / "lh.pial").touch()
+
+    with pytest.raises(
+        FileNotFoundError,
+        match=f"The fsaverage template {tmp_path / 'rh.pial'} could not be found.",
+    ):
+        check_fsaverage_files(tmp_path)
+
+
+def test_get_average_surface_reloads_modified_templates(tmp_path):
+    import numpy as np
+    from nibabel.freesurfer import write_geometry
+
+    from clinica.pipelines.statistics_surface.surfstat._utils import (
+        get_average_surface,
+    )
+
+    faces = np.array([[0, 1, 2]])
+    for hemi in ("lh", "rh"):
+        write_geometry(tmp_path / f"{hemi}.pial", np.zeros((3, 3)), faces)
+    get_average_surface(tmp_path)
+    write_geometry(tmp_path / "lh.pial", np.ones((4, 3)), faces)
+
+    _, average_mesh = get_average_surface(tmp_path)
+
+    assert np.array_equal(
+        average_mesh.coordinates, np.vstack([np.ones((4, 3)), np.zeros((3, 3))])
+    )
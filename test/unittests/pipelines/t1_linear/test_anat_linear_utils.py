@@ -24,3 +24,31 @@ def test_get_substitutions_datasink(suffix):
         f"sub-ADNI022S0004_ses-M000_{suffix}Warped.nii.gz",
         f"sub-ADNI022S0004_ses-M000_space-MNI152NLin2009cSym_res-1x1x1_{suffix}.nii.gz",
     )
+
+
+def test_get_substitutions_datasink_batch():
+    from clinica.pipelines.t1_linear.anat_linear_utils import (
+        _get_substitutions_datasink,
+        _get_substitutions_datasink_batch,
+    )
+
+    bids_image_ids = ["sub-01_ses-M000_T1w", "sub-02_ses-M006_T1w"]
+
+    assert _get_substitutions_datasink_batch(bids_image_ids, "T1w") == [
+        _get_substitutions_datasink(bids_image_id, "T1w")
+        for bids_image_id in bids_image_ids
+    ]
+
+
+def test_get_substitutions_datasink_batch_error():
+    from clinica.pipelines.t1_linear.anat_linear_utils import (
+        _get_substitutions_datasink_batch,
+    )
+
+    with pytest.raises(
+        ValueError,
+        match="bids image ID sub-02_ses-M006_FLAIR should end with provided T1w.",
+    ):
+        _get_substitutions_datasink_batch(
+            ["sub-01_ses-M000_T1w", "sub-02_ses-M006_FLAIR"], "T1w"
+        )
@@ -0,0 +1,92 @@
+from types import SimpleNamespace
+
+
+def _write_segmentation_outputs(
+    caps_dir, image_id, tissues, skip=None, modulations=("off",)
+):
+    subject, session = image_id.split("_")
+    segmentation_dir = (
+        caps_dir / "subjects" / subject / session / "t1" / "spm" / "segmentation"
+    )
+    filenames = []
+    for tissue in tissues:
+        filenames += [
+            f"dartel_input/{image_id}_T1w_segm-{tissue}_dartelinput.nii.gz",
+            f"native_space/{image_id}_T1w_segm-{tissue}_probability.nii.gz",
+        ]
+        filenames += [
+            f"normalized_space/{image_id}_T1w_segm-{tissue}_space-Ixi549Space_modulated-{modulation}_probability.nii.gz"
+            for modulation in modulations
+        ]
+    for filename in filenames:
+        if filename != skip:
+            (segmentation_dir / filename).parent.mkdir(parents=True, exist_ok=True)
+            (segmentation_dir / filename).touch()
+
+
+def test_get_processed_images(tmp_path):
+    from clinica.pipelines.t1_volume_tissue_segmentation.t1_volume_tissue_segmentation_pipeline import (
+        _get_processed_images,
+    )
+
+    tissues = ("graymatter", "whitematter", "csf")
+    _write_segmentation_outputs(tmp_path, "sub-01_ses-M000", tissues)
+    _write_segmentation_outputs(tmp_path, "sub-02_ses-M000", tissues)
+    _write_segmentation_outputs(
+        tmp_path,
+        "sub-01_ses-M006",
+        tissues,
+        skip="native_space/sub-01_ses-M006_T1w_segm-csf_probability.nii.gz",
+    )
+    _write_segmentation_outputs(tmp_path, "sub-03_ses-M000", ("graymatter",))
+
+    subjects = ["sub-02", "sub-01", "sub-01", "sub-03", "sub-04"]
+    sessions = ["ses-M000", "ses-M000", "ses-M006", "ses-M000", "ses-M000"]
+
+    assert _get_processed_images(tmp_path, subjects, sessions) == [
+        "sub-02_ses-M000",
+        "sub-01_ses-M000",
+    ]
+    assert _get_processed_images(
+        tmp_path, subjects, sessions, tissue_classes=[1], dartel_tissues=[1]
+    ) == ["sub-02_ses-M000", "sub-01_ses-M000", "sub-01_ses-M006", "sub-03_ses-M000"]
+
+
+def test_get_processed_images_from_parameters(tmp_path):
+    from clinica.pipelines.t1_volume_tissue_segmentation.t1_volume_tissue_segmentation_pipeline import (
+        T1VolumeTissueSegmentation,
+    )
+
+    _write_segmentation_outputs(
+        tmp_path,
+        "sub-01_ses-M000",
+        ("graymatter", "whitematter", "csf", "bone"),
+        modulations=("on",),
+    )
+    _write_segmentation_outputs(
+        tmp_path,
+        "sub-02_ses-M000",
+        ("graymatter", "whitematter", "csf"),
+        modulations=("on",),
+    )
+    _write_segmentation_outputs(
+        tmp_path,
+        "sub-03_ses-M000",
+        ("graymatter", "whitematter", "csf", "bone"),
+        modulations=("off",),
+    )
+    pipeline = SimpleNamespace(
+        parameters={
+            "tissue_classes": [1, 2, 3, 4],
+            "dartel_tissues": [1],
+            "save_warped_unmodulated": False,
+            "save_warped_modulated": True,
+        }
+    )
+
+    assert T1VolumeTissueSegmentation.get_processed_images(
+        pipeline,
+        tmp_path,
+        ["sub-01", "sub-02", "sub-03"],
+        ["ses-M000", "ses-M000", "ses-M000"],
+    ) == ["sub-01_ses-M000"]
@@ -48,6 +48,28 @@ def test_zip_unzip_nii(tmp_path):
     assert line == "Test"
 
 
+@pytest.mark.parametrize("executable,script", [("pigz", "gzip"), ("unpigz", "gzip -d")])
+def test_zip_unzip_nii_with_pigz(tmp_path, monkeypatch, executable, script):
+    from clinica.utils.filemanip import unzip_nii, zip_nii
+
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    (bin_dir / executable).write_text(
+        f'#!/bin/sh\ntouch "$0.called"\nexec {script} "$@"\n'
+    )
+    (bin_dir / executable).chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    (tmp_path / "foo.nii").write_bytes(b"Test")
+
+    assert zip_nii(tmp_path / "foo.nii", same_dir=True) == str(tmp_path / "foo.nii.gz")
+    os.remove(tmp_path / "foo.nii")
+    assert unzip_nii(tmp_path / "foo.nii.gz", same_dir=True) == str(
+        tmp_path / "foo.nii"
+    )
+    assert (tmp_path / "foo.nii").read_bytes() == b"Test"
+    assert (bin_dir / f"{executable}.called").exists()
+
+
 @pytest.fixture
 def test_image(case) -> nib.Nifti1Image:
     shapes = {
@@ -108,6 +130,7 @@ def test_save_participants_sessions(tmp_path):
         assert col in df.columns
     assert_array_equal(df.participant_id.values, ["sub-01"] * 2)
     assert_array_equal(df.session_id.values, ["ses-M000", "ses-M006"])
+    assert [f.name for f in tmp_path.iterdir()] == ["participants.tsv"]
 
 
 @pytest.mark.parametrize(
@@ -279,3 +302,15 @@ def test_delete_directories(tmp_path):
         )
         assert not (tmp_path / f"folder{i}").exists()
     assert record[3].message.args[0] == f"Was able to remove 180 B of data."
+
+
+@pytest.mark.parametrize("max_workers", [None, 1, 2])
+def test_map_in_threads(max_workers):
+    from clinica.utils.filemanip import map_in_threads
+
+    assert map_in_threads(pow, [2, 3, 4], range(3), max_workers=max_workers) == [
+        1,
+        3,
+        16,
+    ]
+    assert map_in_threads(pow, [], [], max_workers=max_workers) == []
@@ -84,6 +84,30 @@ def test_merge_nifti_images_in_time_dimension_wrong_dimension(tmp_path):
         )
 
 
+@pytest.mark.parametrize(
+    "shapes",
+    [
+        ((5, 5, 5), (5, 5, 1)),
+        ((5, 5, 5, 2), (5, 5, 1, 2)),
+        ((5, 5, 5), (4, 5, 5, 3)),
+    ],
+)
+def test_merge_nifti_images_in_time_dimension_wrong_shape(tmp_path, shapes):
+    from clinica.utils.image import merge_nifti_images_in_time_dimension
+
+    for i, shape in enumerate(shapes):
+        img = nib.Nifti1Image(np.zeros(shape), affine=np.eye(4))
+        nib.save(img, tmp_path / f"foo{i}.nii.gz")
+
+    with pytest.raises(
+        ValueError,
+        match="Only images with the same spatial shape can be concatenated.",
+    ):
+        merge_nifti_images_in_time_dimension(
+            tuple(tmp_path / f"foo{i}.nii.gz" for i in range(2))
+        )
+
+
 @pytest.mark.parametrize("nb_images", [2, 3, 6])
 def test_merge_nifti_images_in_time_dimension(tmp_path, nb_images):
     from clinica.utils.image import merge_nifti_images_in_time_dimension
@@ -163,6 +187,26 @@ def test_remove_dummy_dimension_from_image(tmp_path):
     assert result == str(tmp_path / "output_image.nii.gz")
     assert_array_equal(result_image.affine, np.eye(4))
     assert_array_equal(result_image.get_fdata(), input_data)
+    assert result_image.get_data_dtype() == np.int32
+
+
+def test_remove_dummy_dimension_from_scaled_image(tmp_path):
+    from clinica.utils.image import remove_dummy_dimension_from_image
+
+    input_data = np.random.randint(low=0, high=10, size=(16, 10, 6, 1))
+    input_image = nib.Nifti1Image(input_data.astype(np.int16), affine=np.eye(4))
+    input_image.header.set_slope_inter(0.5, 3.0)
+    nib.save(input_image, tmp_path / "input_image.nii.gz")
+
+    result = remove_dummy_dimension_from_image(
+        str(tmp_path / "input_image.nii.gz"),
+        str(tmp_path / "output_image.nii.gz"),
+    )
+    result_image = nib.load(result)
+
+    assert result_image.shape == (16, 10, 6)
+    assert result_image.get_data_dtype() == np.float32
+    assert_array_equal(result_image.get_fdata(), input_data[..., 0] * 0.5 + 3.0)
 
 
 def test_slice_error():
@@ -196,6 +240,18 @@ def test_mni_cropped_bbox():
     assert MNI_CROP_BBOX.y_slice.end == 221
     assert MNI_CROP_BBOX.z_slice.start == 0
     assert MNI_CROP_BBOX.z_slice.end == 179
+    assert MNI_CROP_BBOX.slices == (slice(12, 181), slice(13, 221), slice(0, 179))
+    assert MNI_CROP_BBOX.get_slices() is MNI_CROP_BBOX.slices
+
+
+def test_crop_array():
+    from clinica.utils.image import Bbox3D, _crop_array  # noqa
+
+    bbox = Bbox3D.from_coordinates(2, 10, 1, 10, 10, 20)
+    cropped = _crop_array(np.ones((30, 30, 30)), bbox)
+
+    assert cropped.shape == (8, 9, 10)
+    assert cropped.sum() == 8 * 9 * 10
 
 
 def test_get_mni_cropped_template(tmp_path, mocker):
@@ -265,6 +321,23 @@ def test_crop_nifti_error(tmp_path):
         crop_nifti(tmp_path / "test.nii.gz")
 
 
+def test_crop_nifti_smaller_than_bbox_error(tmp_path):
+    from clinica.utils.image import crop_nifti
+
+    nib.Nifti1Image(np.random.random((193, 229, 100)), np.eye(4)).to_filename(
+        tmp_path / "test.nii.gz"
+    )
+
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            "The image of shape (193, 229, 100) does not contain the bounding box"
+        ),
+    ):
+        crop_nifti(tmp_path / "test.nii.gz")
+    assert not (tmp_path / "test_cropped.nii.gz").exists()
+
+
 def test_crop_nifti(tmp_path):
     from clinica.utils.image import (
         crop_nifti,
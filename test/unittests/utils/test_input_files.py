@@ -15,6 +15,7 @@ def test_aggregator():
 
     assert toy_func(2) == 4
     assert toy_func((1, 3, 5)) == [1, 9, 25]
+    assert toy_func([1, 3]) == [1, 9]
 
     @aggregator
     def toy_func_2(x, y, z):
@@ -33,6 +34,7 @@ def test_aggregator():
     assert toy_func_3((1, 2), y=(3, 4)) == [(3, 7), (8, 9)]
     assert toy_func_3((1, 2), z=(4, 5)) == [(2, 7), (4, 9)]
     assert toy_func_3(1, y=(3, 5)) == [(3, 7), (5, 9)]
+    assert toy_func_3(x=(1, 2), y=3) == [(3, 7), (6, 8)]
     with pytest.raises(
         ValueError,
         match="Arguments must have the same length.",
@@ -14,6 +14,14 @@ import pytest
                 [["ses-M000", "ses-M018"], ["ses-M000"]],
             ),
         ),
+        (
+            ["sub-CLNC02", "sub-CLNC01", "sub-CLNC02"],
+            ["ses-M000", "ses-M018", "ses-M006"],
+            (
+                ["sub-CLNC01", "sub-CLNC02"],
+                [["ses-M018"], ["ses-M000", "ses-M006"]],
+            ),
+        ),
     ],
 )
 def test_get_unique_subjects(subjects, sessions, expected):
@@ -75,27 +75,15 @@ def test_read_psf_information_errors(tmp_path: Path, psf_df: pd.DataFrame):
             ["ses-M000", "ses-M018"],
             Tracer.FDG,
         )
-    psf_df["foo"] = ["bar"] * 5
-    psf_df.to_csv(tmp_path / "wrong_psf.tsv", sep="\t", index=False)
-    with pytest.raises(
-        IOError,
-        match="must contain",
-    ):
-        read_psf_information(
-            tmp_path / "wrong_psf.tsv",
-            ["sub-CLNC01", "sub-CLNC01"],
-            ["ses-M000", "ses-M018"],
-            Tracer.FDG,
-        )
-    psf_df.drop(["foo", "session_id"], axis=1).to_csv(
-        tmp_path / "wrong_psf_2.tsv", sep="\t", index=False
+    psf_df.drop(["session_id"], axis=1).to_csv(
+        tmp_path / "wrong_psf.tsv", sep="\t", index=False
     )
     with pytest.raises(
         IOError,
-        match="must contain",
+        match=r"Missing columns: \['session_id'\]",
     ):
         read_psf_information(
-            tmp_path / "wrong_psf_2.tsv",
+            tmp_path / "wrong_psf.tsv",
             ["sub-CLNC01", "sub-CLNC01"],
             ["ses-M000", "ses-M018"],
             Tracer.FDG,
@@ -123,6 +111,20 @@ def test_read_psf_information(tmp_path: Path, psf_df: pd.DataFrame):
     ) == [[8, 9, 10], [8, 9, 10]]
 
 
+def test_read_psf_information_extra_columns(tmp_path: Path, psf_df: pd.DataFrame):
+    from clinica.utils.pet import Tracer, read_psf_information
+
+    psf_df["foo"] = ["bar"] * 5
+    psf_df.to_csv(tmp_path / "psf.tsv", sep="\t", index=False)
+
+    assert read_psf_information(
+        tmp_path / "psf.tsv",
+        ["sub-CLNC01", "sub-CLNC02"],
+        ["ses-M018", "ses-M000"],
+        Tracer.FDG,
+    ) == [[8, 9, 10], [8, 9, 10]]
+
+
 @pytest.mark.parametrize("region", SUVRReferenceRegion)
 def test_get_suvr_mask(region):
     from clinica.utils.pet import get_suvr_mask
@@ -85,3 +85,23 @@ def test_get_platform_dependant_matlab_command_error(mocker):
         match="Clinica only support macOS and Linux. Your system is foo.",
     ):
         _get_platform_dependant_matlab_command(Path("/foo/bar"), Path("/foo/bar/baz"))
+
+
+def test_get_tpm(tmp_path):
+    from clinica.utils.spm import get_tpm
+
+    (tmp_path / "spm12" / "tpm").mkdir(parents=True)
+    (tmp_path / "spm12" / "tpm" / "TPM.nii").touch()
+    with mock.patch.dict(os.environ, {"SPM_HOME": str(tmp_path / "spm12")}):
+        assert get_tpm() == str(tmp_path / "spm12" / "tpm" / "TPM.nii")
+        (tmp_path / "spm12" / "tpm" / "TPM.nii").unlink()
+        # The TPM file is only searched once per SPM home directory
+        assert get_tpm() == str(tmp_path / "spm12" / "tpm" / "TPM.nii")
+
+
+def test_get_tpm_error(tmp_path):
+    from clinica.utils.spm import get_tpm
+
+    with mock.patch.dict(os.environ, {"SPM_HOME": str(tmp_path)}):
+        with pytest.raises(RuntimeError, match="No file found for TPM.nii"):
+            get_tpm()